@@ -16,7 +16,7 @@ import os
 import sys
 from datetime import datetime
 from enum import Enum
-from typing import Optional, TextIO, Union
+from typing import Any, Optional, TextIO, Union
 
 from rich.console import Console
 from rich.theme import Theme
@@ -102,6 +102,21 @@ def get_log_level() -> LogLevel:
     return CURRENT_LOG_LEVEL
 
 
+def is_enabled_for(level: LogLevel) -> bool:
+    """Checks whether messages of the given level would be logged.
+    
+    Allows callers to skip building expensive log messages when the
+    message would be filtered out by the current log level anyway.
+    
+    Args:
+        level: The log level to check.
+        
+    Returns:
+        bool: True if messages of this level are currently logged, False otherwise.
+    """
+    return level.value >= CURRENT_LOG_LEVEL.value
+
+
 def set_log_file(file_path: str) -> None:
     """Sets the log file for writing log messages.
     
@@ -223,7 +238,7 @@ def _log(level: LogLevel, message: str, style: str, timestamp: bool = True) -> N
             # just because logging failed
 
 
-def debug(message: str) -> None:
+def debug(message: str, *args: Any) -> None:
     """Logs a debug message.
     
     Outputs a message at DEBUG level. These messages contain detailed information
@@ -231,8 +246,16 @@ def debug(message: str) -> None:
     current log level is set to DEBUG.
     
     Args:
-        message: The message text to log.
+        message: The message text to log. If args are given, it is used as a
+            %-format string and only formatted when the message is actually logged.
+        *args: Optional arguments for %-formatting the message.
     """
+    if LogLevel.DEBUG.value < CURRENT_LOG_LEVEL.value:
+        return
+
+    if args:
+        message = message % args
+
     _log(LogLevel.DEBUG, message, "debug")
 
 
@@ -275,7 +298,7 @@ def warn(message: str) -> None:
     _log(LogLevel.WARNING, message, "warning")
 
 
-def error(message: str) -> None:
+def error(message: str, *args: Any) -> None:
     """Logs an error message.
     
     Outputs a message at ERROR level. These messages indicate errors that
@@ -283,8 +306,16 @@ def error(message: str) -> None:
     if the current log level is set to ERROR or lower.
     
     Args:
-        message: The message text to log.
+        message: The message text to log. If args are given, it is used as a
+            %-format string and only formatted when the message is actually logged.
+        *args: Optional arguments for %-formatting the message.
     """
+    if LogLevel.ERROR.value < CURRENT_LOG_LEVEL.value:
+        return
+
+    if args:
+        message = message % args
+
     _log(LogLevel.ERROR, message, "error")
 
 
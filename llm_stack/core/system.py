@@ -8,6 +8,7 @@ wie die Überprüfung von Systemressourcen, die Sicherstellung, dass Verzeichnis
 import functools
 import os
 import platform
+import re
 import shutil
 import subprocess
 import sys
@@ -19,6 +20,31 @@ import psutil
 
 from llm_stack.core import error, logging
 
+# Exportierte Symbole
+__all__ = [
+    "get_system_info",
+    "format_bytes",
+    "check_system_requirements",
+    "ensure_directory",
+    "backup_file",
+    "command_exists",
+    "get_free_port",
+    "is_port_in_use",
+    "get_script_directory",
+    "get_project_root",
+    "execute_command",
+    "get_environment_variable",
+    "set_environment_variable",
+    "get_file_size",
+    "get_file_modification_time",
+    "list_directory",
+    "is_process_running",
+    "get_memory_usage",
+    "get_self_memory_info",
+    "get_disk_usage",
+    "get_cpu_usage",
+]
+
 # Cache for system information
 _system_info_cache = {}
 _system_info_ttl = 60  # Cache TTL in seconds (1 minute)
@@ -29,6 +55,9 @@ _memory_usage_timestamp = 0
 _disk_usage_cache = {}
 _disk_usage_timestamp = 0
 
+# Shell-Befehlstrenner, die bei shell=True abgelehnt werden (ein Durchlauf statt drei)
+_SHELL_SEP_RE = re.compile(r";|&&|\|\|")
+
 
 def cache_system_info(func: Callable) -> Callable:
     """
@@ -309,7 +338,7 @@ def execute_command(
         # Validate command before execution
         if shell and isinstance(command_args, str):
             # Basic validation for shell commands
-            if ';' in command_args or '&&' in command_args or '||' in command_args:
+            if _SHELL_SEP_RE.search(command_args):
                 logging.error("Potentially unsafe command with shell=True containing command separators")
                 return -1, "", "Security error: Command contains potentially unsafe separators"
         elif not shell and isinstance(command_args, list) and len(command_args) > 0:
@@ -447,6 +476,40 @@ def list_directory(directory_path: str, pattern: Optional[str] = None) -> List[s
         return [os.path.join(directory_path, f) for f in os.listdir(directory_path)]
 
 
+def _proc_name(pid: str) -> Optional[str]:
+    """
+    Liest den Prozessnamen aus /proc wie psutil.Process.name().
+
+    Der Kernel kürzt /proc/<pid>/comm auf 15 Zeichen. Bei einem gekürzten
+    Namen wird daher der Dateiname von argv[0] aus /proc/<pid>/cmdline
+    verwendet, sofern er mit dem gekürzten Namen beginnt.
+
+    Args:
+        pid: Prozess-ID als Verzeichnisname unter /proc
+
+    Returns:
+        Optional[str]: Prozessname oder None, wenn der Prozess nicht lesbar ist
+    """
+    try:
+        with open(f"/proc/{pid}/comm", "rb") as f:
+            name = f.read().decode(errors="ignore").strip()
+    except OSError:
+        return None
+
+    if len(name) >= 15:
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                cmdline = f.read().decode(errors="ignore")
+        except OSError:
+            return name
+        # Prozesse, die ihren Titel ändern, trennen Argumente mit Leerzeichen
+        sep = "\x00" if cmdline.endswith("\x00") else " "
+        exe_name = os.path.basename(cmdline.split(sep, 1)[0])
+        if exe_name.startswith(name):
+            name = exe_name
+    return name
+
+
 def is_process_running(process_name: str) -> bool:
     """
     Prüft, ob ein Prozess läuft.
@@ -457,9 +520,26 @@ def is_process_running(process_name: str) -> bool:
     Returns:
         bool: True, wenn der Prozess läuft, sonst False
     """
+    process_name_lower = process_name.lower()
+
+    # Schneller Pfad unter Linux: nur /proc/<pid>/comm lesen statt psutil-Scan
+    if sys.platform == "linux":
+        try:
+            with os.scandir("/proc") as entries:
+                for entry in entries:
+                    if not entry.name.isdigit():
+                        continue
+                    name = _proc_name(entry.name)
+                    if name is not None and process_name_lower in name.lower():
+                        return True
+            return False
+        except OSError:
+            # /proc nicht verfügbar, auf psutil zurückfallen
+            pass
+
     for proc in psutil.process_iter(["name"]):
         try:
-            if process_name.lower() in proc.info["name"].lower():
+            if process_name_lower in proc.info["name"].lower():
                 return True
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             pass
@@ -497,6 +577,38 @@ def get_memory_usage() -> Dict[str, Union[int, float, str]]:
     return result
 
 
+@functools.lru_cache(maxsize=1)
+def _self_proc(pid: int) -> psutil.Process:
+    """
+    Ruft das (gecachte) psutil.Process-Objekt eines Prozesses ab.
+
+    Der Cache ist nach der Prozess-ID geschlüsselt, damit ein per os.fork()
+    erzeugter Kindprozess nicht das Objekt des Elternprozesses verwendet.
+
+    Args:
+        pid: Prozess-ID, in der Regel os.getpid()
+
+    Returns:
+        psutil.Process: Process-Objekt des Prozesses
+    """
+    return psutil.Process(pid)
+
+
+def get_self_memory_info() -> Any:
+    """
+    Ruft die Speicherinformationen des aktuellen Prozesses ab.
+
+    Prozessbezogene Metriken sollten über diese Funktion abgerufen werden,
+    damit das gecachte Process-Objekt wiederverwendet wird.
+
+    Returns:
+        Any: Speicherinformationen (psutil-Named-Tuple) des aktuellen Prozesses
+    """
+    proc = _self_proc(os.getpid())
+    with proc.oneshot():
+        return proc.memory_info()
+
+
 def get_disk_usage(path: str = "/") -> Dict[str, Union[int, float, str]]:
     """
     Ruft die Festplattennutzung ab mit Caching.
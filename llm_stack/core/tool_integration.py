@@ -5,28 +5,124 @@ This module provides functions for the integration and management of tools.
 It enables listing, checking, executing, and managing tools.
 """
 
+import contextlib
+import copy
+import functools
+import importlib
+import json
+import operator
 import os
-import shutil
-import subprocess
+import stat
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
-
-import yaml
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 
+# yaml, shutil, subprocess und die Knowledge-Graph-Module werden erst bei Bedarf
+# importiert, damit der Import dieses Moduls leichtgewichtig bleibt.
 from llm_stack.core import config, error, interfaces, logging, system, validation
-from llm_stack.knowledge_graph.client import get_client
-from llm_stack.knowledge_graph.migration import (
-    record_bash_file,
-    record_code_transformation,
-    record_migration_decision,
-    record_python_file,
-)
 
 # Constants
 TOOLS_DIR = os.path.join(system.get_project_root(), "tools")
 CONFIG_DIR = os.path.join(system.get_project_root(), "config")
 
+# Tool-Skripte sind vertrauenswürdiger Teil des Stacks und erben ohnehin die
+# Umgebung des Elternprozesses. Auf das Schließen aller Dateideskriptoren im
+# Kindprozess (close_fds=True) wird daher bewusst verzichtet, um den Start zu
+# beschleunigen. Sicherheitshinweis: offene Deskriptoren sind im Tool sichtbar.
+_TOOL_SUBPROCESS_KWARGS: Dict[str, Any] = {"check": False, "close_fds": False}
+
+# Knowledge-Graph-Zugriffe abschalten (LLM_STACK_NO_KG=1), einmalig beim Import gelesen
+_KG_ENABLED = not os.environ.get("LLM_STACK_NO_KG")
+
+# Felder der Tool-Konfiguration, die im Metadaten-Sidecar abgelegt werden
+_METADATA_FIELDS = frozenset(("version", "description", "author"))
+
+
+@functools.lru_cache(maxsize=256)
+def _split_config_key(config_key: str) -> Tuple[str, ...]:
+    """
+    Teilt einen verschachtelten Konfigurationsschlüssel einmalig auf.
+
+    Args:
+        config_key: Konfigurationsschlüssel in Punktnotation (z.B. "tool.version")
+
+    Returns:
+        Tuple[str, ...]: Einzelne Schlüssel
+    """
+    return tuple(config_key.split("."))
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_safe() -> Tuple[Any, Any, Any]:
+    """
+    Importiert yaml bei Bedarf und wählt einmalig Loader und Dumper aus.
+
+    Die libyaml-C-Bindings werden verwendet, falls PyYAML damit gebaut wurde.
+
+    Returns:
+        Tuple[Any, Any, Any]: yaml-Modul, SafeLoader- und SafeDumper-Klasse
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as SafeDumper
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeDumper, SafeLoader
+
+    return yaml, SafeLoader, SafeDumper
+
+
+class ToolPaths(NamedTuple):
+    """Absolute paths of a tool."""
+
+    dir: str  # Tool-Verzeichnis
+    main: str  # Hauptskript
+    config: str  # Konfigurationsdatei
+    meta: str  # Metadaten-Sidecar
+
+
+@functools.lru_cache(maxsize=256)
+def _tool_paths(tools_dir: str, tool_name: str) -> ToolPaths:
+    """
+    Berechnet die Pfade eines Tools einmalig und speichert sie zwischen.
+
+    Args:
+        tools_dir: Verzeichnis, in dem Tools gespeichert sind
+        tool_name: Name des Tools
+
+    Returns:
+        ToolPaths: Pfade des Tools
+    """
+    tool_dir = os.path.join(tools_dir, tool_name)
+    return ToolPaths(
+        dir=tool_dir,
+        main=os.path.join(tool_dir, "main.sh"),
+        config=os.path.join(tool_dir, "config", "config.yaml"),
+        meta=os.path.join(tool_dir, "config", "config.meta.json"),
+    )
+
+
+def _config_metadata(config_data: Any) -> Dict[str, Any]:
+    """
+    Extrahiert die Metadatenfelder aus einer Tool-Konfiguration.
+
+    Args:
+        config_data: Geparste Konfiguration
+
+    Returns:
+        Dict[str, Any]: Version, Beschreibung und Autor des Tools
+    """
+    tool_section = config_data.get("tool", {})
+    return {
+        "version": tool_section.get("version", ""),
+        "description": tool_section.get("description", ""),
+        "author": tool_section.get("author", ""),
+    }
+
 
 class ToolError(error.LLMStackError):
     """Exception for tool errors."""
@@ -55,10 +151,40 @@ class ToolManager:
         self.tools_dir = tools_dir
         self.config_dir = config_dir
         self._tool_instances = {}  # Cache for tool instances
+        # Cache for resolved tool classes
+        self._tool_classes: Dict[str, Optional[type]] = {}
+        # Tool listing (sorted, set) and the mtime (ns) of tools_dir it belongs to
+        self._tools_cache: Optional[Tuple[Tuple[str, ...], frozenset]] = None
+        self._tools_cache_mtime: int = -1
+        self._yaml_cache: Dict[str, Tuple[int, Any]] = {}  # Parsed config files by path
+        # Serializes config read-modify-write cycles
+        self._config_write_lock = threading.Lock()
         logging.debug(
-            f"ToolManager initialized with tools_dir={tools_dir}, config_dir={config_dir}"
+            "ToolManager initialized with tools_dir=%s, config_dir=%s",
+            tools_dir,
+            config_dir,
         )
 
+    def _paths(self, tool_name: str) -> ToolPaths:
+        """Returns the precomputed paths of a tool."""
+        return _tool_paths(self.tools_dir, tool_name)
+
+    def _tool_dir(self, tool_name: str) -> str:
+        """Returns the directory of a tool."""
+        return _tool_paths(self.tools_dir, tool_name).dir
+
+    def _main_script(self, tool_name: str) -> str:
+        """Returns the path to the main script of a tool."""
+        return _tool_paths(self.tools_dir, tool_name).main
+
+    def _config_file(self, tool_name: str) -> str:
+        """Returns the path to the configuration file of a tool."""
+        return _tool_paths(self.tools_dir, tool_name).config
+
+    def _meta_file(self, tool_name: str) -> str:
+        """Returns the path to the metadata sidecar of a tool."""
+        return _tool_paths(self.tools_dir, tool_name).meta
+
     def get_available_tools(self) -> List[str]:
         """
         Returns a list of all available tools.
@@ -68,28 +194,64 @@ class ToolManager:
         """
         logging.debug("Retrieving available tools")
 
+        # The sorted view is cached alongside the set, so listing does not re-sort
+        tools = list(self._tools_snapshot()[0])
+
+        if logging.is_enabled_for(logging.LogLevel.DEBUG):
+            logging.debug("Available tools: %s", ", ".join(tools))
+        return tools
+
+    def _scan_tools(self) -> frozenset:
+        """
+        Scans the tools directory for available tools.
+
+        Returns:
+            frozenset: Set of tool names
+        """
         try:
             # Find all directories in the tools directory that are not hidden directories
             # and not the template directory
-            tools = []
-            if os.path.isdir(self.tools_dir):
-                for item in os.listdir(self.tools_dir):
-                    item_path = os.path.join(self.tools_dir, item)
-                    if (
-                        os.path.isdir(item_path)
-                        and not item.startswith(".")
-                        and item != "template"
-                    ):
-                        tools.append(item)
-
-            # Sort the tools
-            tools.sort()
-
-            logging.debug(f"Available tools: {', '.join(tools)}")
-            return tools
+            # (os.scandir reuses the file type from readdir instead of a stat per entry)
+            with os.scandir(self.tools_dir) as entries:
+                return frozenset(
+                    entry.name
+                    for entry in entries
+                    if entry.is_dir()
+                    and not entry.name.startswith(".")
+                    and entry.name != "template"
+                )
+        except FileNotFoundError:
+            return frozenset()
         except Exception as e:
             logging.error(f"Error retrieving available tools: {str(e)}")
-            return []
+            return frozenset()
+
+    def _tools_snapshot(self) -> Tuple[Tuple[str, ...], frozenset]:
+        """
+        Returns the available tools, cached by the mtime of the tools directory.
+
+        Returns:
+            Tuple[Tuple[str, ...], frozenset]: Sorted tool names and the same names
+                as a set
+        """
+        try:
+            mtime = os.stat(self.tools_dir).st_mtime_ns
+        except FileNotFoundError:
+            mtime = -1
+
+        if self._tools_cache is None or mtime != self._tools_cache_mtime:
+            tools = self._scan_tools()
+            self._tools_cache = (tuple(sorted(tools)), tools)
+            self._tools_cache_mtime = mtime
+
+        return self._tools_cache
+
+    def invalidate(self) -> None:
+        """
+        Invalidates the cached tool listing.
+        """
+        self._tools_cache = None
+        self._tools_cache_mtime = -1
 
     def tool_exists(self, tool_name: str) -> bool:
         """
@@ -101,16 +263,77 @@ class ToolManager:
         Returns:
             bool: True if the tool exists, False otherwise
         """
-        tool_dir = os.path.join(self.tools_dir, tool_name)
-        exists = os.path.isdir(tool_dir)
+        # Directory check instead of the cached listing: the listing leaves out
+        # the template and hidden directories, which must still count as existing
+        exists = os.path.isdir(self._tool_dir(tool_name))
 
         if exists:
-            logging.debug(f"Tool exists: {tool_name}")
+            logging.debug("Tool exists: %s", tool_name)
         else:
-            logging.debug(f"Tool does not exist: {tool_name}")
+            logging.debug("Tool does not exist: %s", tool_name)
 
         return exists
         
+    def _resolve_tool_class(self, tool_name: str) -> Optional[type]:
+        """
+        Resolves the class of a tool that implements the ToolInterface.
+
+        The result (including a negative result) is cached per tool, so the
+        module import and attribute scan are only performed once.
+
+        Args:
+            tool_name: Name of the tool
+
+        Returns:
+            Optional[type]: Class implementing the ToolInterface or None if there
+                is none
+        """
+        if tool_name in self._tool_classes:
+            return self._tool_classes[tool_name]
+
+        tool_class = None
+        tool_path = f"llm_stack.tools.{tool_name}"
+        try:
+            # Already imported modules are served straight from sys.modules
+            tool_module = sys.modules.get(tool_path) or importlib.import_module(
+                tool_path
+            )
+
+            # Find the first class that implements ToolInterface. Only classes
+            # defined in the tool package itself are considered, so imported classes
+            # (stdlib, ABCs, ...) are skipped before the comparatively expensive
+            # issubclass check.
+            tool_interface = interfaces.ToolInterface
+            module_name = tool_module.__name__
+            module_prefix = module_name + "."
+            for attr_name, attr in vars(tool_module).items():
+                # isinstance instead of "type(attr) is type": ToolInterface classes
+                # use ABCMeta
+                if not isinstance(attr, type) or attr is tool_interface:
+                    continue
+                attr_module = getattr(attr, "__module__", "")
+                if attr_module != module_name and not attr_module.startswith(
+                    module_prefix
+                ):
+                    continue
+                if issubclass(attr, tool_interface):
+                    logging.debug(
+                        "Tool %s implements ToolInterface with class %s",
+                        tool_name,
+                        attr_name,
+                    )
+                    tool_class = attr
+                    break
+            else:
+                logging.debug("Tool %s does not implement ToolInterface", tool_name)
+        except ImportError:
+            logging.debug("Could not import tool %s", tool_path)
+        except Exception as e:
+            logging.error(f"Error checking if tool {tool_name} implements ToolInterface: {str(e)}")
+
+        self._tool_classes[tool_name] = tool_class
+        return tool_class
+
     def implements_interface(self, tool_name: str) -> bool:
         """
         Checks if a tool implements the ToolInterface.
@@ -122,30 +345,10 @@ class ToolManager:
             bool: True if the tool implements the ToolInterface, False otherwise
         """
         if not self.tool_exists(tool_name):
-            logging.debug(f"Tool does not exist: {tool_name}")
-            return False
-            
-        try:
-            # Try to import the tool
-            tool_path = f"llm_stack.tools.{tool_name}"
-            try:
-                tool_module = __import__(tool_path, fromlist=["__init__"])
-                
-                # Check if the module has a class that implements ToolInterface
-                for attr_name in dir(tool_module):
-                    attr = getattr(tool_module, attr_name)
-                    if isinstance(attr, type) and issubclass(attr, interfaces.ToolInterface) and attr != interfaces.ToolInterface:
-                        logging.debug(f"Tool {tool_name} implements ToolInterface with class {attr_name}")
-                        return True
-                
-                logging.debug(f"Tool {tool_name} does not implement ToolInterface")
-                return False
-            except ImportError:
-                logging.debug(f"Could not import tool {tool_path}")
-                return False
-        except Exception as e:
-            logging.error(f"Error checking if tool {tool_name} implements ToolInterface: {str(e)}")
+            logging.debug("Tool does not exist: %s", tool_name)
             return False
+
+        return self._resolve_tool_class(tool_name) is not None
             
     def get_tool_instance(self, tool_name: str) -> Optional[interfaces.ToolInterface]:
         """
@@ -155,7 +358,8 @@ class ToolManager:
             tool_name: Name of the tool
             
         Returns:
-            Optional[ToolInterface]: Instance of the tool or None if the tool does not implement the interface
+            Optional[ToolInterface]: Instance of the tool or None if the tool does
+                not implement the interface
             
         Raises:
             ToolError: If the tool does not exist
@@ -166,37 +370,83 @@ class ToolManager:
             logging.error(error_msg)
             raise ToolError(error_msg)
             
+        return self._instantiate_tool(tool_name)
+
+    def _instantiate_tool(self, tool_name: str) -> Optional[interfaces.ToolInterface]:
+        """
+        Gets the (cached) ToolInterface instance of a tool.
+
+        The existence of the tool must already have been checked.
+
+        Args:
+            tool_name: Name of the tool
+
+        Returns:
+            Optional[ToolInterface]: Instance of the tool or None if the tool does
+                not implement the interface
+        """
         # Check if we already have an instance
-        if tool_name in self._tool_instances:
-            return self._tool_instances[tool_name]
-            
-        # Check if the tool implements the interface
-        if not self.implements_interface(tool_name):
-            logging.debug(f"Tool {tool_name} does not implement ToolInterface")
+        instance = self._tool_instances.get(tool_name)
+        if instance is not None:
+            return instance
+
+        # Resolve the class that implements ToolInterface
+        tool_class = self._resolve_tool_class(tool_name)
+        if tool_class is None:
+            logging.debug("Tool %s does not implement ToolInterface", tool_name)
             return None
-            
+
         try:
-            # Import the tool
-            tool_path = f"llm_stack.tools.{tool_name}"
-            tool_module = __import__(tool_path, fromlist=["__init__"])
-            
-            # Find the class that implements ToolInterface
-            for attr_name in dir(tool_module):
-                attr = getattr(tool_module, attr_name)
-                if isinstance(attr, type) and issubclass(attr, interfaces.ToolInterface) and attr != interfaces.ToolInterface:
-                    # Create an instance of the class
-                    instance = attr()
-                    self._tool_instances[tool_name] = instance
-                    logging.debug(f"Created instance of {attr_name} for tool {tool_name}")
-                    return instance
-                    
-            logging.debug(f"No class implementing ToolInterface found in tool {tool_name}")
-            return None
+            # Create an instance of the class
+            instance = tool_class()
+            self._tool_instances[tool_name] = instance
+            logging.debug(
+                "Created instance of %s for tool %s", tool_class.__name__, tool_name
+            )
+            return instance
         except Exception as e:
             error_msg = f"Error creating instance of tool {tool_name}: {str(e)}"
             logging.error(error_msg)
             return None
 
+    def _stat_main_script(self, tool_name: str) -> str:
+        """
+        Checks the main script of a tool with a single stat call.
+
+        Args:
+            tool_name: Name of the tool
+
+        Returns:
+            str: Path to the executable main script
+
+        Raises:
+            ToolError: If the tool does not exist, has no main script or the
+                main script is not executable
+        """
+        main_script = self._main_script(tool_name)
+
+        try:
+            st = os.stat(main_script)
+        except (FileNotFoundError, NotADirectoryError):
+            if self.tool_exists(tool_name):
+                error_msg = f"Tool has no main script: {tool_name}"
+            else:
+                error_msg = f"Tool does not exist: {tool_name}"
+            logging.error(error_msg)
+            raise ToolError(error_msg)
+
+        if not stat.S_ISREG(st.st_mode):
+            error_msg = f"Tool has no main script: {tool_name}"
+            logging.error(error_msg)
+            raise ToolError(error_msg)
+
+        if not st.st_mode & 0o111:
+            error_msg = f"Main script of the tool is not executable: {tool_name}"
+            logging.error(error_msg)
+            raise ToolError(error_msg)
+
+        return main_script
+
     def run_tool(self, tool_name: str, *args: str, **kwargs) -> Union[int, Dict]:
         """
         Executes a tool with arguments.
@@ -218,11 +468,11 @@ class ToolManager:
             logging.error(error_msg)
             raise ToolError(error_msg)
             
-        # First try to use the ToolInterface if implemented
-        tool_instance = self.get_tool_instance(tool_name)
+        # First try to use the ToolInterface if implemented (existence already checked)
+        tool_instance = self._instantiate_tool(tool_name)
         if tool_instance:
             try:
-                logging.debug(f"Executing tool {tool_name} using ToolInterface")
+                logging.debug("Executing tool %s using ToolInterface", tool_name)
                 
                 # Initialize the tool if not already initialized
                 if not hasattr(tool_instance, '_initialized') or not tool_instance._initialized:
@@ -245,28 +495,18 @@ class ToolManager:
                 # Fall back to file-based approach
 
         # Fall back to file-based approach
-        # Path to the main script of the tool
-        main_script = os.path.join(self.tools_dir, tool_name, "main.sh")
-
-        # Check if the main script exists
-        if not os.path.isfile(main_script):
-            error_msg = f"Tool has no main script: {tool_name}"
-            logging.error(error_msg)
-            raise ToolError(error_msg)
-
-        # Check if the main script is executable
-        if not os.access(main_script, os.X_OK):
-            error_msg = f"Main script of the tool is not executable: {tool_name}"
-            logging.error(error_msg)
-            raise ToolError(error_msg)
+        # Path to the (executable) main script of the tool
+        main_script = self._stat_main_script(tool_name)
 
         # Arguments as string for logging
         args_str = " ".join(args)
         logging.info(f"Executing tool: {tool_name} {args_str}")
 
         try:
+            import subprocess
+
             # Execute the tool
-            result = subprocess.run([main_script, *args], check=False)
+            result = subprocess.run([main_script, *args], **_TOOL_SUBPROCESS_KWARGS)
             exit_code = result.returncode
 
             if exit_code != 0:
@@ -284,7 +524,7 @@ class ToolManager:
             logging.error(error_msg)
             raise ToolError(error_msg)
 
-    def get_tool_help(self, tool_name: str) -> int:
+    def get_tool_help(self, tool_name: str) -> Union[int, str]:
         """
         Gibt die Hilfe für ein Tool aus.
 
@@ -292,7 +532,8 @@ class ToolManager:
             tool_name: Name des Tools
 
         Returns:
-            int: Exit-Code des Tools
+            Union[int, str]: Exit-Code des Tools oder Hilfetext bei Verwendung des
+                ToolInterface
 
         Raises:
             ToolError: Wenn das Tool nicht existiert oder keine Hilfe verfügbar ist
@@ -303,8 +544,15 @@ class ToolManager:
             logging.error(error_msg)
             raise ToolError(error_msg)
 
+        # Zuerst das ToolInterface verwenden, falls implementiert
+        # (kein Subprozess nötig)
+        tool_instance = self._instantiate_tool(tool_name)
+        if tool_instance is not None:
+            info = tool_instance.get_info()
+            return info.get("help", info.get("description", ""))
+
         # Pfad zum Hauptskript des Tools
-        main_script = os.path.join(self.tools_dir, tool_name, "main.sh")
+        main_script = self._main_script(tool_name)
 
         # Prüfen, ob das Hauptskript existiert
         if not os.path.isfile(main_script):
@@ -313,15 +561,17 @@ class ToolManager:
             raise ToolError(error_msg)
 
         try:
+            import subprocess
+
             # Tool mit --help-Option ausführen
-            result = subprocess.run([main_script, "--help"], check=False)
+            result = subprocess.run([main_script, "--help"], **_TOOL_SUBPROCESS_KWARGS)
             return result.returncode
         except Exception as e:
             error_msg = f"Fehler beim Abrufen der Hilfe für Tool {tool_name}: {str(e)}"
             logging.error(error_msg)
             raise ToolError(error_msg)
 
-    def get_tool_version(self, tool_name: str) -> int:
+    def get_tool_version(self, tool_name: str) -> Union[int, str]:
         """
         Gibt die Version eines Tools aus.
 
@@ -329,7 +579,8 @@ class ToolManager:
             tool_name: Name des Tools
 
         Returns:
-            int: Exit-Code des Tools
+            Union[int, str]: Exit-Code des Tools oder Versionsstring bei Verwendung
+                des ToolInterface
 
         Raises:
             ToolError: Wenn das Tool nicht existiert oder keine Version verfügbar ist
@@ -340,8 +591,15 @@ class ToolManager:
             logging.error(error_msg)
             raise ToolError(error_msg)
 
+        # Zuerst das ToolInterface verwenden, falls implementiert
+        # (kein Subprozess nötig)
+        tool_instance = self._instantiate_tool(tool_name)
+        if tool_instance is not None:
+            info = tool_instance.get_info()
+            return info.get("version", "")
+
         # Pfad zum Hauptskript des Tools
-        main_script = os.path.join(self.tools_dir, tool_name, "main.sh")
+        main_script = self._main_script(tool_name)
 
         # Prüfen, ob das Hauptskript existiert
         if not os.path.isfile(main_script):
@@ -350,8 +608,12 @@ class ToolManager:
             raise ToolError(error_msg)
 
         try:
+            import subprocess
+
             # Tool mit --version-Option ausführen
-            result = subprocess.run([main_script, "--version"], check=False)
+            result = subprocess.run(
+                [main_script, "--version"], **_TOOL_SUBPROCESS_KWARGS
+            )
             return result.returncode
         except Exception as e:
             error_msg = (
@@ -360,6 +622,99 @@ class ToolManager:
             logging.error(error_msg)
             raise ToolError(error_msg)
 
+    def _load_config(self, config_file: str) -> Any:
+        """
+        Lädt eine YAML-Konfigurationsdatei, zwischengespeichert nach Änderungszeit.
+
+        Args:
+            config_file: Pfad zur Konfigurationsdatei
+
+        Returns:
+            Any: Geparste Konfiguration
+        """
+        mtime = os.stat(config_file).st_mtime_ns
+        entry = self._yaml_cache.get(config_file)
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+
+        yaml, SafeLoader, _ = _yaml_safe()
+
+        with open(config_file) as f:
+            config_data = yaml.load(f, Loader=SafeLoader)
+
+        self._yaml_cache[config_file] = (mtime, config_data)
+        return config_data
+
+    def _read_meta_sidecar(
+        self, meta_file: str, config_stat: os.stat_result
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Liest den Metadaten-Sidecar, sofern er zum Stand der Konfiguration passt.
+
+        Der Sidecar enthält mtime (ns) und Größe der Konfigurationsdatei, aus
+        der er erzeugt wurde. Er gilt nur bei exakt gleichen Werten als aktuell,
+        sodass auch eine Konfiguration mit älterer mtime (z.B. nach einem
+        Checkout) erkannt wird.
+
+        Args:
+            meta_file: Pfad zum Metadaten-Sidecar
+            config_stat: os.stat-Ergebnis der Konfigurationsdatei
+
+        Returns:
+            Optional[Dict[str, Any]]: Metadatenfelder oder None, wenn der Sidecar
+                fehlt, veraltet oder unlesbar ist
+        """
+        try:
+            with open(meta_file, "rb") as f:
+                sidecar = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(sidecar, dict) or (
+            sidecar.get("config_mtime_ns") != config_stat.st_mtime_ns
+            or sidecar.get("config_size") != config_stat.st_size
+        ):
+            return None
+
+        fields = sidecar.get("metadata")
+        if not isinstance(fields, dict) or not _METADATA_FIELDS <= fields.keys():
+            return None
+        return fields
+
+    def _write_meta_sidecar(
+        self, meta_file: str, config_stat: os.stat_result, fields: Dict[str, Any]
+    ) -> None:
+        """
+        Schreibt den Metadaten-Sidecar atomar.
+
+        Der Sidecar ist nur eine Optimierung; Fehler werden protokolliert, aber
+        nicht weitergereicht.
+
+        Args:
+            meta_file: Pfad zum Metadaten-Sidecar
+            config_stat: os.stat-Ergebnis der Konfigurationsdatei, aus der die
+                Felder stammen
+            fields: Metadatenfelder
+        """
+        sidecar = {
+            "config_mtime_ns": config_stat.st_mtime_ns,
+            "config_size": config_stat.st_size,
+            "metadata": fields,
+        }
+        tmp_file = f"{meta_file}.tmp"
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(sidecar, f)
+            os.replace(tmp_file, meta_file)
+        except (OSError, TypeError, ValueError) as e:
+            logging.debug(
+                "Metadaten-Sidecar %s konnte nicht geschrieben werden: %s",
+                meta_file,
+                e,
+            )
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+
     def get_tool_config(
         self, tool_name: str, config_key: Optional[str] = None
     ) -> Optional[Union[str, Dict]]:
@@ -383,7 +738,7 @@ class ToolManager:
             raise ToolError(error_msg)
 
         # Pfad zur Konfigurationsdatei
-        config_file = os.path.join(self.tools_dir, tool_name, "config", "config.yaml")
+        config_file = self._config_file(tool_name)
 
         # Prüfen, ob die Konfigurationsdatei existiert
         if not os.path.isfile(config_file):
@@ -393,29 +748,24 @@ class ToolManager:
 
         try:
             # YAML-Datei lesen
-            with open(config_file) as f:
-                config_data = yaml.safe_load(f)
+            config_data = self._load_config(config_file)
 
             # Wenn ein Konfigurationsschlüssel angegeben ist, nur diesen Wert zurückgeben
             if config_key:
                 # Schlüssel aufteilen, um verschachtelte Werte zu unterstützen
-                keys = config_key.split(".")
-                value = config_data
-
-                for key in keys:
-                    if isinstance(value, dict) and key in value:
-                        value = value[key]
-                    else:
-                        error_msg = (
-                            f"Konfigurationsschlüssel nicht gefunden: {config_key}"
-                        )
-                        logging.error(error_msg)
-                        return None
+                keys = _split_config_key(config_key)
 
-                return value
+                try:
+                    config_value = functools.reduce(operator.getitem, keys, config_data)
+                except (KeyError, TypeError):
+                    error_msg = (
+                        f"Konfigurationsschlüssel nicht gefunden: {config_key}"
+                    )
+                    logging.error(error_msg)
+                    return None
             else:
                 # Gesamte Konfiguration zurückgeben
-                return config_data
+                config_value = config_data
         except Exception as e:
             error_msg = (
                 f"Fehler beim Abrufen der Konfiguration für Tool {tool_name}: {str(e)}"
@@ -423,6 +773,9 @@ class ToolManager:
             logging.error(error_msg)
             raise ToolError(error_msg)
 
+        # Kopie zurückgeben, damit Änderungen des Aufrufers den Cache nicht verändern
+        return copy.deepcopy(config_value)
+
     def set_tool_config(
         self, tool_name: str, config_key: str, config_value: Any
     ) -> bool:
@@ -453,7 +806,7 @@ class ToolManager:
             raise ToolError(error_msg)
 
         # Pfad zur Konfigurationsdatei
-        config_file = os.path.join(self.tools_dir, tool_name, "config", "config.yaml")
+        config_file = self._config_file(tool_name)
 
         # Prüfen, ob die Konfigurationsdatei existiert
         if not os.path.isfile(config_file):
@@ -461,28 +814,50 @@ class ToolManager:
             logging.error(error_msg)
             raise ToolError(error_msg)
 
-        try:
-            # YAML-Datei lesen
-            with open(config_file) as f:
-                config_data = yaml.safe_load(f)
+        yaml, _, SafeDumper = _yaml_safe()
 
-            # Konfigurationswert setzen
-            # Schlüssel aufteilen, um verschachtelte Werte zu unterstützen
-            keys = config_key.split(".")
-            current = config_data
-
-            # Durch die Schlüssel navigieren, bis auf den letzten
-            for key in keys[:-1]:
-                if key not in current:
-                    current[key] = {}
-                current = current[key]
-
-            # Letzten Schlüssel setzen
-            current[keys[-1]] = config_value
+        try:
+            with self._config_write_lock:
+                # YAML-Datei lesen (Kopie, damit der Cache bei Fehlern
+                # unverändert bleibt)
+                config_data = copy.deepcopy(self._load_config(config_file))
 
-            # YAML-Datei schreiben
-            with open(config_file, "w") as f:
-                yaml.dump(config_data, f)
+                # Konfigurationswert setzen
+                # Schlüssel aufteilen, um verschachtelte Werte zu unterstützen
+                keys = _split_config_key(config_key)
+                current = config_data
+
+                # Durch die Schlüssel navigieren, bis auf den letzten
+                for key in keys[:-1]:
+                    if key not in current:
+                        current[key] = {}
+                    current = current[key]
+
+                # Letzten Schlüssel setzen (Kopie, da die Daten in den Cache gehen)
+                current[keys[-1]] = copy.deepcopy(config_value)
+
+                # YAML-Datei atomar schreiben (temporäre Datei + os.replace), damit
+                # Leser nie eine halb geschriebene Datei sehen
+                tmp_file = f"{config_file}.tmp"
+                try:
+                    with open(tmp_file, "w") as f:
+                        yaml.dump(config_data, f, Dumper=SafeDumper)
+                    os.replace(tmp_file, config_file)
+                except BaseException:
+                    if os.path.exists(tmp_file):
+                        os.remove(tmp_file)
+                    raise
+
+                # Cache mit den geschriebenen Daten aktualisieren
+                config_stat = os.stat(config_file)
+                self._yaml_cache[config_file] = (config_stat.st_mtime_ns, config_data)
+
+                # Metadaten-Sidecar neu schreiben, damit Leser kein YAML parsen müssen
+                self._write_meta_sidecar(
+                    self._meta_file(tool_name),
+                    config_stat,
+                    _config_metadata(config_data),
+                )
 
             logging.info(
                 f"Tool-Konfiguration aktualisiert: {tool_name}.{config_key}={config_value}"
@@ -522,10 +897,14 @@ class ToolManager:
 
         logging.info(f"Initialisiere neues Tool: {tool_name}")
 
+        import shutil
+
+        tool_dir = self._tool_dir(tool_name)
+
+        # Beim Aufräumen nur ein Verzeichnis entfernen, das dieser Aufruf angelegt hat
+        created_tool_dir = not os.path.lexists(tool_dir)
+
         try:
-            # Tool-Verzeichnis erstellen
-            tool_dir = os.path.join(self.tools_dir, tool_name)
-            os.makedirs(tool_dir, exist_ok=True)
 
             # Template-Dateien kopieren
             template_dir = os.path.join(self.tools_dir, "template")
@@ -534,39 +913,44 @@ class ToolManager:
                 logging.error(error_msg)
                 raise ToolError(error_msg)
 
-            # Alle Dateien und Verzeichnisse aus dem Template-Verzeichnis kopieren
-            for item in os.listdir(template_dir):
-                source = os.path.join(template_dir, item)
-                destination = os.path.join(tool_dir, item)
-
-                if os.path.isdir(source):
-                    shutil.copytree(source, destination)
-                else:
-                    shutil.copy2(source, destination)
+            # Tool-Verzeichnis mit allen Dateien und Verzeichnissen des Templates
+            # erstellen
+            shutil.copytree(template_dir, tool_dir, dirs_exist_ok=True)
 
             # Tool-Namen in Dateien aktualisieren
             for root, _, files in os.walk(tool_dir):
                 for file in files:
                     file_path = os.path.join(root, file)
 
-                    # Nur Textdateien bearbeiten
-                    try:
-                        with open(file_path) as f:
-                            content = f.read()
+                    with open(file_path, "rb") as f:
+                        content = f.read()
 
-                        # "template" durch den Tool-Namen ersetzen
-                        content = content.replace("template", tool_name)
+                    # Dateien ohne "template" nicht neu schreiben
+                    if b"template" not in content:
+                        continue
 
-                        with open(file_path, "w") as f:
-                            f.write(content)
+                    # Nur Textdateien bearbeiten
+                    try:
+                        text = content.decode("utf-8")
                     except UnicodeDecodeError:
                         # Binärdateien überspringen
-                        pass
+                        continue
+
+                    # "template" durch den Tool-Namen ersetzen
+                    with open(file_path, "wb") as f:
+                        f.write(text.replace("template", tool_name).encode("utf-8"))
+
+            # Hauptskript ausführbar machen (vorhandene Rechte des Templates
+            # beibehalten)
+            main_script = self._main_script(tool_name)
+            try:
+                st = os.stat(main_script)
+                os.chmod(main_script, st.st_mode | 0o111)
+            except FileNotFoundError:
+                pass
 
-            # Hauptskript ausführbar machen
-            main_script = os.path.join(tool_dir, "main.sh")
-            if os.path.isfile(main_script):
-                os.chmod(main_script, 0o755)
+            # Zwischengespeicherte Tool-Liste verwerfen
+            self.invalidate()
 
             logging.success(f"Tool erfolgreich initialisiert: {tool_name}")
             return True
@@ -577,12 +961,70 @@ class ToolManager:
             logging.error(error_msg)
 
             # Aufräumen bei Fehler
-            tool_dir = os.path.join(self.tools_dir, tool_name)
-            if os.path.isdir(tool_dir):
+            if created_tool_dir and os.path.isdir(tool_dir):
                 shutil.rmtree(tool_dir)
+            self.invalidate()
 
             raise ToolError(error_msg)
 
+    def _find_test_scripts(self, test_dir: str) -> List[str]:
+        """
+        Findet alle ausführbaren Test-Skripte eines Verzeichnisses.
+
+        Args:
+            test_dir: Verzeichnis mit den Test-Skripten (test_*.sh)
+
+        Returns:
+            List[str]: Sortierte Pfade der Test-Skripte
+        """
+        # Präfix/Suffix statt Glob-Muster, Dateityp aus readdir
+        with os.scandir(test_dir) as entries:
+            return sorted(
+                entry.path
+                for entry in entries
+                if entry.name.startswith("test_")
+                and entry.name.endswith(".sh")
+                and entry.is_file()
+                and os.access(entry.path, os.X_OK)
+            )
+
+    def _run_test_scripts(self, test_scripts: List[Tuple[str, str]]) -> int:
+        """
+        Führt Test-Skripte parallel aus.
+
+        Args:
+            test_scripts: Paare aus Pfad des Test-Skripts und Bezeichnung der
+                Tests für Fehlermeldungen
+
+        Returns:
+            int: 0, wenn alle Tests bestanden wurden, sonst der Exit-Code des
+                letzten fehlgeschlagenen Test-Skripts
+        """
+        if not test_scripts:
+            return 0
+
+        import subprocess
+
+        def run_script(test_script: Tuple[str, str]) -> int:
+            logging.debug("Führe Test-Skript aus: %s", test_script[0])
+            result = subprocess.run([test_script[0]], **_TOOL_SUBPROCESS_KWARGS)
+            return result.returncode
+
+        # Test-Skripte blockieren im Kernel, daher parallel in Threads ausführen
+        with ThreadPoolExecutor(max_workers=min(8, len(test_scripts))) as executor:
+            return_codes = list(executor.map(run_script, test_scripts))
+
+        exit_code = 0
+        for (test_script, test_label), return_code in zip(test_scripts, return_codes):
+            if return_code != 0:
+                logging.error(
+                    f"{test_label} fehlgeschlagen: {test_script} "
+                    f"(Exit-Code: {return_code})"
+                )
+                exit_code = return_code
+
+        return exit_code
+
     def run_tool_tests(self, tool_name: str, test_type: str = "all") -> int:
         """
         Führt Tests für ein Tool aus.
@@ -606,52 +1048,39 @@ class ToolManager:
         logging.info(f"Führe {test_type}-Tests für Tool aus: {tool_name}")
 
         # Pfad zum Test-Verzeichnis
-        test_dir = os.path.join(self.tools_dir, tool_name, "tests")
-        exit_code = 0
+        test_dir = os.path.join(self._tool_dir(tool_name), "tests")
+        test_scripts: List[Tuple[str, str]] = []
 
         try:
-            # Unit-Tests ausführen
+            # Unit-Tests finden
             if test_type == "unit" or test_type == "all":
                 unit_test_dir = os.path.join(test_dir, "unit")
                 if os.path.isdir(unit_test_dir):
                     logging.info("Führe Unit-Tests aus...")
-
-                    # Alle Test-Skripte finden und ausführen
-                    for test_script in Path(unit_test_dir).glob("test_*.sh"):
-                        if os.access(test_script, os.X_OK):
-                            logging.debug(f"Führe Test-Skript aus: {test_script}")
-                            result = subprocess.run([str(test_script)], check=False)
-
-                            if result.returncode != 0:
-                                logging.error(
-                                    f"Unit-Test fehlgeschlagen: {test_script} (Exit-Code: {result.returncode})"
-                                )
-                                exit_code = result.returncode
+                    test_scripts.extend(
+                        (test_script, "Unit-Test")
+                        for test_script in self._find_test_scripts(unit_test_dir)
+                    )
                 else:
                     logging.warning(f"Keine Unit-Tests gefunden für Tool: {tool_name}")
 
-            # Integrationstests ausführen
+            # Integrationstests finden
             if test_type == "integration" or test_type == "all":
                 integration_test_dir = os.path.join(test_dir, "integration")
                 if os.path.isdir(integration_test_dir):
                     logging.info("Führe Integrationstests aus...")
-
-                    # Alle Test-Skripte finden und ausführen
-                    for test_script in Path(integration_test_dir).glob("test_*.sh"):
-                        if os.access(test_script, os.X_OK):
-                            logging.debug(f"Führe Test-Skript aus: {test_script}")
-                            result = subprocess.run([str(test_script)], check=False)
-
-                            if result.returncode != 0:
-                                logging.error(
-                                    f"Integrationstest fehlgeschlagen: {test_script} (Exit-Code: {result.returncode})"
-                                )
-                                exit_code = result.returncode
+                    test_scripts.extend(
+                        (test_script, "Integrationstest")
+                        for test_script in self._find_test_scripts(integration_test_dir)
+                    )
                 else:
                     logging.warning(
                         f"Keine Integrationstests gefunden für Tool: {tool_name}"
                     )
 
+            # Unit- und Integrationstests gemeinsam in einem Thread-Pool ausführen
+            exit_code = self._run_test_scripts(test_scripts)
+
             if exit_code == 0:
                 logging.success(f"Alle Tests bestanden für Tool: {tool_name}")
             else:
@@ -684,23 +1113,26 @@ class ToolManager:
             logging.error(error_msg)
             raise ToolError(error_msg)
             
-        # First try to use the ToolInterface if implemented
-        tool_instance = self.get_tool_instance(tool_name)
+        # First try to use the ToolInterface if implemented (existence already checked)
+        tool_instance = self._instantiate_tool(tool_name)
         if tool_instance:
             try:
-                logging.debug(f"Getting metadata for tool {tool_name} using ToolInterface")
+                logging.debug(
+                    "Getting metadata for tool %s using ToolInterface", tool_name
+                )
                 info = tool_instance.get_info()
                 if info:
                     # Add path to the metadata
-                    info["path"] = os.path.join(self.tools_dir, tool_name)
+                    info["path"] = self._tool_dir(tool_name)
                     return info
             except Exception as e:
                 logging.error(f"Error getting metadata for tool {tool_name} using ToolInterface: {str(e)}")
                 # Fall back to file-based approach
 
         # Fall back to file-based approach
-        # Path to the configuration file
-        config_file = os.path.join(self.tools_dir, tool_name, "config", "config.yaml")
+        # Paths to the configuration file and its metadata sidecar
+        paths = self._paths(tool_name)
+        config_file = paths.config
 
         # Check if the configuration file exists
         if not os.path.isfile(config_file):
@@ -709,22 +1141,22 @@ class ToolManager:
             raise ToolError(error_msg)
 
         try:
-            # Read YAML file
-            with open(config_file) as f:
-                config_data = yaml.safe_load(f)
-
-            # Extract metadata
-            tool_version = config_data.get("tool", {}).get("version", "")
-            tool_description = config_data.get("tool", {}).get("description", "")
-            tool_author = config_data.get("tool", {}).get("author", "")
+            # Prefer the JSON sidecar; parse the YAML file only if it is missing
+            # or stale. The stat is taken before parsing, so a concurrent change
+            # leaves a sidecar that no longer matches instead of a stale one.
+            config_stat = os.stat(config_file)
+            fields = self._read_meta_sidecar(paths.meta, config_stat)
+            if fields is None:
+                fields = _config_metadata(self._load_config(config_file))
+                self._write_meta_sidecar(paths.meta, config_stat, fields)
 
             # Return metadata as dictionary
             metadata = {
                 "name": tool_name,
-                "version": tool_version,
-                "description": tool_description,
-                "author": tool_author,
-                "path": os.path.join(self.tools_dir, tool_name),
+                "version": fields["version"],
+                "description": fields["description"],
+                "author": fields["author"],
+                "path": paths.dir,
             }
 
             return metadata
@@ -734,26 +1166,23 @@ class ToolManager:
             raise ToolError(error_msg)
 
 
-# Globale Instanz des ToolManagers
-_tool_manager = None
-
-
+# Globale Instanz des ToolManagers (functools.cache ist erst ab Python 3.9 verfügbar)
+@functools.lru_cache(maxsize=None)
 def get_tool_manager() -> ToolManager:
     """
     Gibt eine Instanz des ToolManagers zurück.
 
+    Die Instanz wird beim ersten Aufruf erzeugt und danach aus dem Cache
+    geliefert; ein Aufruf ist damit ein einzelner Cache-Treffer ohne Sperre.
+
     Returns:
         ToolManager: Instanz des ToolManagers
     """
-    global _tool_manager
-
-    if _tool_manager is None:
-        _tool_manager = ToolManager()
-
-    return _tool_manager
+    return ToolManager()
 
 
 # Hilfsfunktionen für einfachen Zugriff auf ToolManager-Methoden
+# (get_tool_manager() ist memoisiert, ein zusätzlicher Cache ist daher nicht nötig)
 
 
 def get_available_tools() -> List[str]:
@@ -797,7 +1226,7 @@ def run_tool(tool_name: str, *args: str, **kwargs) -> Union[int, Dict]:
     return get_tool_manager().run_tool(tool_name, *args, **kwargs)
 
 
-def get_tool_help(tool_name: str) -> Union[int, Dict]:
+def get_tool_help(tool_name: str) -> Union[int, str]:
     """
     Gets help information for a tool.
 
@@ -805,7 +1234,7 @@ def get_tool_help(tool_name: str) -> Union[int, Dict]:
         tool_name: Name of the tool
 
     Returns:
-        Union[int, Dict]: Exit code of the tool or help information if using ToolInterface
+        Union[int, str]: Exit code of the tool or help text if using ToolInterface
 
     Raises:
         ToolError: If the tool does not exist or no help is available
@@ -899,6 +1328,22 @@ def run_tool_tests(tool_name: str, test_type: str = "all") -> int:
     return get_tool_manager().run_tool_tests(tool_name, test_type)
 
 
+@functools.lru_cache(maxsize=128)
+def _cached_tool_metadata(tool_name: str, config_mtime: int) -> Optional[Dict]:
+    """
+    Gets metadata for a file-based tool, memoized by tool name and config file mtime.
+
+    Args:
+        tool_name: Name of the tool
+        config_mtime: mtime (ns) of the tool's configuration file (part of the
+            cache key)
+
+    Returns:
+        Optional[Dict]: Metadata of the tool or None if an error occurred
+    """
+    return get_tool_manager().get_tool_metadata(tool_name)
+
+
 def get_tool_metadata(tool_name: str) -> Optional[Dict]:
     """
     Gets metadata for a tool.
@@ -912,522 +1357,139 @@ def get_tool_metadata(tool_name: str) -> Optional[Dict]:
     Raises:
         ToolError: If the tool does not exist or no metadata is available
     """
-    return get_tool_manager().get_tool_metadata(tool_name)
+    manager = get_tool_manager()
 
+    # ToolInterface tools report metadata via get_info(), which can change
+    # without the configuration file changing, so it is never memoized
+    if manager.implements_interface(tool_name):
+        return manager.get_tool_metadata(tool_name)
 
-# Migrationsentscheidungen im Knowledge Graph aufzeichnen
-try:
-    client = get_client()
+    try:
+        config_mtime = os.stat(manager._config_file(tool_name)).st_mtime_ns
+    except OSError:
+        # No configuration file: let the manager decide (ToolInterface or error)
+        return manager.get_tool_metadata(tool_name)
 
-    # Migrationsentscheidungen aufzeichnen
-    record_migration_decision(
-        decision="Objektorientierter Ansatz mit ToolManager-Klasse",
-        rationale="Die Verwendung einer ToolManager-Klasse ermöglicht eine bessere Kapselung der Funktionalität und erleichtert das Testen.",
-        bash_file_path="lib/core/tool_integration.sh",
-        python_file_path="llm_stack/core/tool_integration.py",
-        alternatives=[
+    metadata = _cached_tool_metadata(tool_name, config_mtime)
+    # Return a copy so callers cannot modify the cached entry
+    return dict(metadata) if metadata is not None else None
+
+
+@functools.lru_cache(maxsize=8)
+def _read_source(path: str, mtime: float) -> str:
+    """
+    Liest den Quelltext einer Datei, zwischengespeichert nach Pfad und Änderungszeit.
+
+    Args:
+        path: Pfad zur Datei
+        mtime: Änderungszeit der Datei (Teil des Cache-Schlüssels)
+
+    Returns:
+        str: Inhalt der Datei
+    """
+    return Path(path).read_text(encoding="utf-8")
+
+
+# Migrationsentscheidungen für den Knowledge Graph
+# (statisch, einmalig beim Laden erzeugt)
+_MIGRATION_DECISIONS: Tuple[Dict[str, Any], ...] = (
+    {
+        "decision": "Objektorientierter Ansatz mit ToolManager-Klasse",
+        "rationale": "Die Verwendung einer ToolManager-Klasse ermöglicht eine bessere Kapselung der Funktionalität und erleichtert das Testen.",
+        "bash_file_path": "lib/core/tool_integration.sh",
+        "python_file_path": "llm_stack/core/tool_integration.py",
+        "alternatives": [
             "Funktionaler Ansatz wie in der Bash-Datei",
             "Singleton-Muster ohne globale Funktionen",
         ],
-        impact="Verbesserte Wartbarkeit und Testbarkeit, konsistenter mit anderen Python-Modulen",
-    )
-
-    record_migration_decision(
-        decision="Verwendung von YAML statt yq für Konfigurationsverarbeitung",
-        rationale="Python hat mit PyYAML eine native Unterstützung für YAML-Verarbeitung, was die Abhängigkeit von externen Tools reduziert.",
-        bash_file_path="lib/core/tool_integration.sh",
-        python_file_path="llm_stack/core/tool_integration.py",
-        alternatives=[
+        "impact": "Verbesserte Wartbarkeit und Testbarkeit, konsistenter mit anderen Python-Modulen",
+    },
+    {
+        "decision": "Verwendung von YAML statt yq für Konfigurationsverarbeitung",
+        "rationale": "Python hat mit PyYAML eine native Unterstützung für YAML-Verarbeitung, was die Abhängigkeit von externen Tools reduziert.",
+        "bash_file_path": "lib/core/tool_integration.sh",
+        "python_file_path": "llm_stack/core/tool_integration.py",
+        "alternatives": [
             "Verwendung von subprocess für yq-Aufrufe",
             "Verwendung von JSON statt YAML",
         ],
-        impact="Reduzierte externe Abhängigkeiten, bessere Typsicherheit und Fehlerbehandlung",
-    )
-    
-    record_migration_decision(
-        decision="Integration with ToolInterface for tool operations",
-        rationale="Using the ToolInterface provides a standardized way to interact with tools, reducing reliance on file structure and conventions.",
-        bash_file_path="lib/core/tool_integration.sh",
-        python_file_path="llm_stack/core/tool_integration.py",
-        alternatives=[
+        "impact": "Reduzierte externe Abhängigkeiten, bessere Typsicherheit und Fehlerbehandlung",
+    },
+    {
+        "decision": "Integration with ToolInterface for tool operations",
+        "rationale": "Using the ToolInterface provides a standardized way to interact with tools, reducing reliance on file structure and conventions.",
+        "bash_file_path": "lib/core/tool_integration.sh",
+        "python_file_path": "llm_stack/core/tool_integration.py",
+        "alternatives": [
             "Continue using only file-based approach",
             "Replace file-based approach entirely with interface-based approach",
         ],
-        impact="Improved flexibility, maintainability, and adherence to the specification manifest while maintaining backward compatibility",
-    )
-
-    record_migration_decision(
-        decision="Einführung einer spezifischen ToolError-Klasse",
-        rationale="Eine spezifische Fehlerklasse ermöglicht eine bessere Fehlerbehandlung und -unterscheidung.",
-        bash_file_path="lib/core/tool_integration.sh",
-        python_file_path="llm_stack/core/tool_integration.py",
-        alternatives=[
+        "impact": "Improved flexibility, maintainability, and adherence to the specification manifest while maintaining backward compatibility",
+    },
+    {
+        "decision": "Einführung einer spezifischen ToolError-Klasse",
+        "rationale": "Eine spezifische Fehlerklasse ermöglicht eine bessere Fehlerbehandlung und -unterscheidung.",
+        "bash_file_path": "lib/core/tool_integration.sh",
+        "python_file_path": "llm_stack/core/tool_integration.py",
+        "alternatives": [
             "Verwendung allgemeiner Exceptions",
             "Rückgabe von Fehlercodes wie in der Bash-Version",
         ],
-        impact="Verbesserte Fehlerbehandlung und -diagnose",
-    )
+        "impact": "Verbesserte Fehlerbehandlung und -diagnose",
+    },
+)
 
-    # Bash-Datei aufzeichnen
-    record_bash_file(
-        "lib/core/tool_integration.sh",
-        """#!/bin/bash
-# lib/core/tool_integration.sh
-# Standardized tool integration library for LOCAL-LLM-Stack
-
-# Guard against multiple inclusion
-if [[ -n "$_CORE_TOOL_INTEGRATION_SH_INCLUDED" ]]; then
-  return 0
-fi
-_CORE_TOOL_INTEGRATION_SH_INCLUDED=1
-
-# Get the absolute path of the script directory
-TOOL_INTEGRATION_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-ROOT_DIR="$(cd "$TOOL_INTEGRATION_DIR/../.." && pwd)"
-
-# Source dependencies
-source "$TOOL_INTEGRATION_DIR/logging.sh"
-source "$TOOL_INTEGRATION_DIR/error.sh"
-source "$TOOL_INTEGRATION_DIR/validation.sh"
-source "$TOOL_INTEGRATION_DIR/config.sh"
-
-# Tool directories
-readonly TOOLS_DIR="$ROOT_DIR/tools"
-readonly CONFIG_DIR="$ROOT_DIR/config"
-
-# Get a list of all available tools
-#
-# Returns:
-#   Space-separated list of tool names
-function get_available_tools() {
-  find "$TOOLS_DIR" -mindepth 1 -maxdepth 1 -type d -not -path "*/\\.*" -not -path "*/template" | sort | xargs -n1 basename
-}
-
-# Check if a tool exists
-#
-# Parameters:
-#   $1 - Tool name
-#
-# Returns:
-#   0 - Tool exists
-#   1 - Tool does not exist
-function tool_exists() {
-  local tool_name=$1
-  
-  if [[ -d "$TOOLS_DIR/$tool_name" ]]; then
-    return 0
-  else
-    return 1
-  fi
-}
-
-# Run a tool with arguments
-#
-# Parameters:
-#   $1 - Tool name
-#   $@ - Additional arguments to pass to the tool
-#
-# Returns:
-#   Tool exit code
-function run_tool() {
-  local tool_name=$1
-  shift
-  
-  # Check if tool exists
-  if ! tool_exists "$tool_name"; then
-    log_error "Tool does not exist: $tool_name"
-    return $ERR_NOT_FOUND
-  fi
-  
-  # Check if tool has a main script
-  local main_script="$TOOLS_DIR/$tool_name/main.sh"
-  if [[ ! -f "$main_script" ]]; then
-    log_error "Tool has no main script: $tool_name"
-    return $ERR_NOT_IMPLEMENTED
-  fi
-  
-  # Check if main script is executable
-  if [[ ! -x "$main_script" ]]; then
-    log_error "Tool main script is not executable: $tool_name"
-    return $ERR_PERMISSION_DENIED
-  fi
-  
-  log_info "Running tool: $tool_name $@"
-  
-  # Run the tool
-  "$main_script" "$@"
-  local result=$?
-  
-  if [[ $result -ne 0 ]]; then
-    log_error "Tool execution failed: $tool_name (exit code: $result)"
-  else
-    log_success "Tool execution completed successfully: $tool_name"
-  fi
-  
-  return $result
-}
-
-# Get tool help
-#
-# Parameters:
-#   $1 - Tool name
-#
-# Returns:
-#   Tool help text
-function get_tool_help() {
-  local tool_name=$1
-  
-  # Check if tool exists
-  if ! tool_exists "$tool_name"; then
-    log_error "Tool does not exist: $tool_name"
-    return $ERR_NOT_FOUND
-  fi
-  
-  # Check if tool has a main script
-  local main_script="$TOOLS_DIR/$tool_name/main.sh"
-  if [[ ! -f "$main_script" ]]; then
-    log_error "Tool has no main script: $tool_name"
-    return $ERR_NOT_IMPLEMENTED
-  fi
-  
-  # Run the tool with --help
-  "$main_script" --help
-  return $?
-}
-
-# Get tool version
-#
-# Parameters:
-#   $1 - Tool name
-#
-# Returns:
-#   Tool version
-function get_tool_version() {
-  local tool_name=$1
-  
-  # Check if tool exists
-  if ! tool_exists "$tool_name"; then
-    log_error "Tool does not exist: $tool_name"
-    return $ERR_NOT_FOUND
-  fi
-  
-  # Check if tool has a main script
-  local main_script="$TOOLS_DIR/$tool_name/main.sh"
-  if [[ ! -f "$main_script" ]]; then
-    log_error "Tool has no main script: $tool_name"
-    return $ERR_NOT_IMPLEMENTED
-  fi
-  
-  # Run the tool with --version
-  "$main_script" --version
-  return $?
-}
-
-# Get tool configuration
-#
-# Parameters:
-#   $1 - Tool name
-#   $2 - Configuration key (optional)
-#
-# Returns:
-#   Tool configuration
-function get_tool_config() {
-  local tool_name=$1
-  local config_key=$2
-  
-  # Check if tool exists
-  if ! tool_exists "$tool_name"; then
-    log_error "Tool does not exist: $tool_name"
-    return $ERR_NOT_FOUND
-  fi
-  
-  # Check if tool has a configuration file
-  local config_file="$TOOLS_DIR/$tool_name/config/config.yaml"
-  if [[ ! -f "$config_file" ]]; then
-    log_error "Tool has no configuration file: $tool_name"
-    return $ERR_NOT_FOUND
-  fi
-  
-  # Check if yq is available
-  if ! command -v yq &> /dev/null; then
-    log_error "yq is required to read YAML configuration"
-    return $ERR_DEPENDENCY_MISSING
-  fi
-  
-  # Get configuration
-  if [[ -n "$config_key" ]]; then
-    yq eval ".$config_key" "$config_file"
-  else
-    cat "$config_file"
-  fi
-  
-  return $ERR_SUCCESS
-}
-
-# Set tool configuration
-#
-# Parameters:
-#   $1 - Tool name
-#   $2 - Configuration key
-#   $3 - Configuration value
-#
-# Returns:
-#   0 - Success
-#   Non-zero - Error code
-function set_tool_config() {
-  local tool_name=$1
-  local config_key=$2
-  local config_value=$3
-  
-  # Check if tool exists
-  if ! tool_exists "$tool_name"; then
-    log_error "Tool does not exist: $tool_name"
-    return $ERR_NOT_FOUND
-  fi
-  
-  # Check if configuration key is provided
-  if [[ -z "$config_key" ]]; then
-    log_error "Configuration key is required"
-    return $ERR_INVALID_ARGUMENT
-  fi
-  
-  # Check if tool has a configuration file
-  local config_file="$TOOLS_DIR/$tool_name/config/config.yaml"
-  if [[ ! -f "$config_file" ]]; then
-    log_error "Tool has no configuration file: $tool_name"
-    return $ERR_NOT_FOUND
-  fi
-  
-  # Check if yq is available
-  if ! command -v yq &> /dev/null; then
-    log_error "yq is required to modify YAML configuration"
-    return $ERR_DEPENDENCY_MISSING
-  fi
-  
-  # Update configuration
-  yq eval -i ".$config_key = \"$config_value\"" "$config_file"
-  local result=$?
-  
-  if [[ $result -ne 0 ]]; then
-    log_error "Failed to update tool configuration: $tool_name.$config_key"
-    return $ERR_GENERAL
-  }
-  
-  log_info "Updated tool configuration: $tool_name.$config_key=$config_value"
-  return $ERR_SUCCESS
-}
-
-# Initialize a new tool
-#
-# Parameters:
-#   $1 - Tool name
-#
-# Returns:
-#   0 - Success
-#   Non-zero - Error code
-function initialize_tool() {
-  local tool_name=$1
-  
-  # Check if tool name is provided
-  if [[ -z "$tool_name" ]]; then
-    log_error "Tool name is required"
-    return $ERR_INVALID_ARGUMENT
-  fi
-  
-  # Check if tool already exists
-  if tool_exists "$tool_name"; then
-    log_error "Tool already exists: $tool_name"
-    return $ERR_ALREADY_EXISTS
-  fi
-  
-  log_info "Initializing new tool: $tool_name"
-  
-  # Create tool directory
-  local tool_dir="$TOOLS_DIR/$tool_name"
-  mkdir -p "$tool_dir"
-  
-  # Copy template files
-  cp -r "$TOOLS_DIR/template/"* "$tool_dir/"
-  
-  # Update tool name in files
-  find "$tool_dir" -type f -exec sed -i "s/template/$tool_name/g" {} \\;
-  
-  # Make scripts executable
-  chmod +x "$tool_dir/main.sh"
-  
-  log_success "Tool initialized successfully: $tool_name"
-  return $ERR_SUCCESS
-}
-
-# Run tool tests
-#
-# Parameters:
-#   $1 - Tool name
-#   $2 - Test type (unit, integration, all) (default: all)
-#
-# Returns:
-#   0 - Success
-#   Non-zero - Error code
-function run_tool_tests() {
-  local tool_name=$1
-  local test_type=${2:-all}
-  
-  # Check if tool exists
-  if ! tool_exists "$tool_name"; then
-    log_error "Tool does not exist: $tool_name"
-    return $ERR_NOT_FOUND
-  fi
-  
-  log_info "Running $test_type tests for tool: $tool_name"
-  
-  local test_dir="$TOOLS_DIR/$tool_name/tests"
-  local exit_code=0
-  
-  # Run unit tests
-  if [[ "$test_type" == "unit" || "$test_type" == "all" ]]; then
-    if [[ -d "$test_dir/unit" ]]; then
-      log_info "Running unit tests..."
-      find "$test_dir/unit" -name "test_*.sh" -type f -executable | while read -r test_script; do
-        log_debug "Running test script: $test_script"
-        "$test_script"
-        local result=$?
-        if [[ $result -ne 0 ]]; then
-          log_error "Unit test failed: $test_script (exit code: $result)"
-          exit_code=$result
-        fi
-      done
-    else
-      log_warning "No unit tests found for tool: $tool_name"
-    fi
-  fi
-  
-  # Run integration tests
-  if [[ "$test_type" == "integration" || "$test_type" == "all" ]]; then
-    if [[ -d "$test_dir/integration" ]]; then
-      log_info "Running integration tests..."
-      find "$test_dir/integration" -name "test_*.sh" -type f -executable | while read -r test_script; do
-        log_debug "Running test script: $test_script"
-        "$test_script"
-        local result=$?
-        if [[ $result -ne 0 ]]; then
-          log_error "Integration test failed: $test_script (exit code: $result)"
-          exit_code=$result
-        fi
-      done
-    else
-      log_warning "No integration tests found for tool: $tool_name"
-    fi
-  fi
-  
-  if [[ $exit_code -eq 0 ]]; then
-    log_success "All tests passed for tool: $tool_name"
-  else
-    log_error "Tests failed for tool: $tool_name"
-  fi
-  
-  return $exit_code
-}
-
-# Get tool metadata
-#
-# Parameters:
-#   $1 - Tool name
-#
-# Returns:
-#   Tool metadata in JSON format
-function get_tool_metadata() {
-  local tool_name=$1
-  
-  # Check if tool exists
-  if ! tool_exists "$tool_name"; then
-    log_error "Tool does not exist: $tool_name"
-    return $ERR_NOT_FOUND
-  fi
-  
-  # Check if tool has a configuration file
-  local config_file="$TOOLS_DIR/$tool_name/config/config.yaml"
-  if [[ ! -f "$config_file" ]]; then
-    log_error "Tool has no configuration file: $tool_name"
-    return $ERR_NOT_FOUND
-  fi
-  
-  # Check if yq is available
-  if ! command -v yq &> /dev/null; then
-    log_error "yq is required to read YAML configuration"
-    return $ERR_DEPENDENCY_MISSING
-  fi
-  
-  # Get tool metadata
-  local tool_version=$(yq eval '.tool.version' "$config_file")
-  local tool_description=$(yq eval '.tool.description' "$config_file")
-  local tool_author=$(yq eval '.tool.author' "$config_file")
-  
-  # Output metadata as JSON
-  echo "{"
-  echo "  \"name\": \"$tool_name\","
-  echo "  \"version\": \"$tool_version\","
-  echo "  \"description\": \"$tool_description\","
-  echo "  \"author\": \"$tool_author\","
-  echo "  \"path\": \"$TOOLS_DIR/$tool_name\""
-  echo "}"
-  
-  return $ERR_SUCCESS
-}
+# Code-Transformationen für den Knowledge Graph
+_CODE_TRANSFORMATIONS: Tuple[Dict[str, Any], ...] = (
+    {
+        "transformation_type": "function_to_class_method",
+        "before": r"""function get_available_tools() {
+  find "$TOOLS_DIR" -mindepth 1 -maxdepth 1 -type d -not -path "*/\.*" -not -path "*/template" | sort | xargs -n1 basename
+}""",
+        "after": """def get_available_tools(self) -> List[str]:
+        \"\"\"
+        Returns a list of all available tools.
 
-# Log initialization of the tool integration library
-log_debug "Tool integration library initialized"
-""",
-    )
+        Returns:
+            List[str]: List of tool names
+        \"\"\"
+        logging.debug("Retrieving available tools")
 
-    # Python-Datei aufzeichnen
-    record_python_file(
-        "llm_stack/core/tool_integration.py",
-        open(__file__).read(),
-        "lib/core/tool_integration.sh",
-    )
+        # The sorted view is cached alongside the set, so listing does not re-sort
+        tools = list(self._tools_snapshot()[0])
 
-    # Code-Transformationen aufzeichnen
-    record_code_transformation(
-        transformation_type="function_to_class_method",
-        before=r"""function get_available_tools() {
-  find "$TOOLS_DIR" -mindepth 1 -maxdepth 1 -type d -not -path "*/\.*" -not -path "*/template" | sort | xargs -n1 basename
-}""",
-        after="""def get_available_tools(self) -> List[str]:
+        if logging.is_enabled_for(logging.LogLevel.DEBUG):
+            logging.debug("Available tools: %s", ", ".join(tools))
+        return tools
+
+    def _scan_tools(self) -> frozenset:
         \"\"\"
-        Gibt eine Liste aller verfügbaren Tools zurück.
-        
+        Scans the tools directory for available tools.
+
         Returns:
-            List[str]: Liste der Tool-Namen
+            frozenset: Set of tool names
         \"\"\"
-        logging.debug("Rufe verfügbare Tools ab")
-        
         try:
-            # Alle Verzeichnisse im Tools-Verzeichnis finden, die keine versteckten Verzeichnisse sind
-            # und nicht das Template-Verzeichnis sind
-            tools = []
-            if os.path.isdir(self.tools_dir):
-                for item in os.listdir(self.tools_dir):
-                    item_path = os.path.join(self.tools_dir, item)
-                    if (os.path.isdir(item_path) and
-                        not item.startswith('.') and
-                        item != 'template'):
-                        tools.append(item)
-            
-            # Sortieren der Tools
-            tools.sort()
-            
-            logging.debug(f"Verfügbare Tools: {', '.join(tools)}")
-            return tools
+            # (os.scandir reuses the file type from readdir instead of a stat per entry)
+            with os.scandir(self.tools_dir) as entries:
+                return frozenset(
+                    entry.name
+                    for entry in entries
+                    if entry.is_dir()
+                    and not entry.name.startswith(".")
+                    and entry.name != "template"
+                )
+        except FileNotFoundError:
+            return frozenset()
         except Exception as e:
-            logging.error(f"Fehler beim Abrufen der verfügbaren Tools: {str(e)}")
-            return []""",
-        bash_file_path="lib/core/tool_integration.sh",
-        python_file_path="llm_stack/core/tool_integration.py",
-    )
-
-    record_code_transformation(
-        transformation_type="yaml_processing",
-        before="""  # Check if yq is available
+            logging.error(f"Error retrieving available tools: {str(e)}")
+            return frozenset()""",
+        "bash_file_path": "lib/core/tool_integration.sh",
+        "python_file_path": "llm_stack/core/tool_integration.py",
+    },
+    {
+        "transformation_type": "yaml_processing",
+        "before": """  # Check if yq is available
   if ! command -v yq &> /dev/null; then
     log_error "yq is required to read YAML configuration"
     return $ERR_DEPENDENCY_MISSING
@@ -1439,50 +1501,132 @@ log_debug "Tool integration library initialized"
   else
     cat "$config_file"
   fi""",
-        after="""            # YAML-Datei lesen
+        "after": """            # YAML-Datei lesen (libyaml-C-Loader, falls verfügbar)
+            yaml, SafeLoader, _ = _yaml_safe()
             with open(config_file, "r") as f:
-                config_data = yaml.safe_load(f)
+                config_data = yaml.load(f, Loader=SafeLoader)
             
             # Wenn ein Konfigurationsschlüssel angegeben ist, nur diesen Wert zurückgeben
             if config_key:
                 # Schlüssel aufteilen, um verschachtelte Werte zu unterstützen
-                keys = config_key.split(".")
-                value = config_data
+                keys = _split_config_key(config_key)
                 
-                for key in keys:
-                    if isinstance(value, dict) and key in value:
-                        value = value[key]
-                    else:
-                        error_msg = f"Konfigurationsschlüssel nicht gefunden: {config_key}"
-                        logging.error(error_msg)
-                        return None
-                
-                return value
+                try:
+                    return functools.reduce(operator.getitem, keys, config_data)
+                except (KeyError, TypeError):
+                    error_msg = f"Konfigurationsschlüssel nicht gefunden: {config_key}"
+                    logging.error(error_msg)
+                    return None
             else:
                 # Gesamte Konfiguration zurückgeben
                 return config_data""",
-        bash_file_path="lib/core/tool_integration.sh",
-        python_file_path="llm_stack/core/tool_integration.py",
-    )
-
-    record_code_transformation(
-        transformation_type="error_handling",
-        before="""  # Check if tool exists
+        "bash_file_path": "lib/core/tool_integration.sh",
+        "python_file_path": "llm_stack/core/tool_integration.py",
+    },
+    {
+        "transformation_type": "error_handling",
+        "before": """  # Check if tool exists
   if ! tool_exists "$tool_name"; then
     log_error "Tool does not exist: $tool_name"
     return $ERR_NOT_FOUND
   fi""",
-        after="""        # Prüfen, ob das Tool existiert
+        "after": """        # Prüfen, ob das Tool existiert
         if not self.tool_exists(tool_name):
             error_msg = f"Tool existiert nicht: {tool_name}"
             logging.error(error_msg)
             raise ToolError(error_msg)""",
-        bash_file_path="lib/core/tool_integration.sh",
-        python_file_path="llm_stack/core/tool_integration.py",
+        "bash_file_path": "lib/core/tool_integration.sh",
+        "python_file_path": "llm_stack/core/tool_integration.py",
+    },
+)
+
+
+def _record_batch(
+    record_func: Callable[..., Any], payloads: Tuple[Dict[str, Any], ...], client: Any
+) -> None:
+    """
+    Zeichnet mehrere voneinander unabhängige Einträge parallel im Knowledge Graph auf.
+
+    Args:
+        record_func: Aufzeichnungsfunktion (z.B. record_migration_decision)
+        payloads: Schlüsselwortargumente je Eintrag
+        client: Knowledge-Graph-Client, der für alle Einträge verwendet wird
+    """
+    if not payloads:
+        return
+
+    # Verbindung und Indizes beim ersten Eintrag seriell herstellen: weder
+    # connect() noch ensure_indexes sind gegen parallele Aufrufe abgesichert.
+    # Ohne Verbindung würde jeder Eintrag erneut connect() aufrufen, daher
+    # dann alles seriell aufzeichnen.
+    if not client.ensure_connected():
+        for payload in payloads:
+            record_func(**payload, client=client)
+        return
+    record_func(**payloads[0], client=client)
+
+    # Übrige Einträge parallel senden, statt jeden Roundtrip abzuwarten
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(
+            executor.map(
+                lambda payload: record_func(**payload, client=client), payloads[1:]
+            )
+        )
+
+
+def _record_migration_metadata() -> None:
+    """
+    Zeichnet die Migrationsentscheidungen dieses Moduls im Knowledge Graph auf.
+
+    Wird nur ausgeführt, wenn die Umgebungsvariable LLM_STACK_RECORD_MIGRATION
+    gesetzt und LLM_STACK_NO_KG nicht gesetzt ist, damit der Import des Moduls
+    keine Datei- und Datenbankzugriffe auslöst.
+    """
+    from llm_stack.knowledge_graph.client import get_client
+    from llm_stack.knowledge_graph.migration import (
+        record_bash_file_from_path,
+        record_code_transformation,
+        record_migration_decision,
+        record_python_file,
     )
 
-except Exception as e:
-    logging.error(f"Fehler beim Aufzeichnen der Migration im Knowledge Graph: {str(e)}")
+    client = get_client()
+
+    # Migrationsentscheidungen aufzeichnen
+    _record_batch(record_migration_decision, _MIGRATION_DECISIONS, client)
+
+    # Bash-Datei aufzeichnen (Inhalt wird vom Datenträger gelesen)
+    record_bash_file_from_path(
+        "lib/core/tool_integration.sh",
+        os.path.join(
+            system.get_project_root(),
+            "local-llm-stack",
+            "lib",
+            "core",
+            "tool_integration.sh",
+        ),
+        client=client,
+    )
+
+    # Python-Datei aufzeichnen
+    record_python_file(
+        "llm_stack/core/tool_integration.py",
+        _read_source(__file__, os.path.getmtime(__file__)),
+        "lib/core/tool_integration.sh",
+        client=client,
+    )
+
+    # Code-Transformationen aufzeichnen
+    _record_batch(record_code_transformation, _CODE_TRANSFORMATIONS, client)
+
+
+# Migrationsentscheidungen im Knowledge Graph aufzeichnen (nur auf Anforderung)
+# Erwartete Fehler (Knowledge-Graph-Abhängigkeiten fehlen, Datei- oder
+# Datenbankfehler) werden unterdrückt; die record_*-Funktionen protokollieren
+# ihre Fehler selbst, Programmierfehler werden nicht verschluckt
+if _KG_ENABLED and os.environ.get("LLM_STACK_RECORD_MIGRATION"):
+    with contextlib.suppress(ImportError, OSError, error.LLMStackError):
+        _record_migration_metadata()
 
 
 # Modul initialisieren
@@ -7,17 +7,54 @@ The validation functions follow a consistent pattern of accepting a value to val
 optional validation parameters, and a name parameter for error messages.
 """
 
+import functools
 import ipaddress
 import os
 import re
-from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple, Union, TypeVar, Generic
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NoReturn,
+    Optional,
+    Pattern,
+    Set,
+    Sized,
+    Tuple,
+    Union,
+)
 
 from llm_stack.core import error, logging
 
-# Type variable for generic validation functions
-T = TypeVar('T')
+# Strings accepted as boolean values (lower case)
+_BOOLEAN_STRINGS = frozenset({"true", "false", "yes", "no", "1", "0", "y", "n"})
+
+# Per-thread nesting depth of validate_any; failures inside it are not logged
+_quiet = threading.local()
 
 # Helper functions to reduce duplication
+def _raise_validation_error(exc: error.ValidationError) -> NoReturn:
+    """
+    Log a validation error and raise it.
+
+    The exception message is used as log message, so it is only formatted
+    once. Inside validate_any, where failed alternatives are expected, the
+    error is raised without being logged.
+
+    Args:
+        exc: The validation error to raise
+
+    Raises:
+        ValidationError: Always, the given exception
+    """
+    if not getattr(_quiet, "depth", 0):
+        logging.error(exc.message)
+    raise exc
+
 def _handle_validation_error(value: Any, expected_type: str, name: str) -> None:
     """
     Handle type validation errors consistently.
@@ -30,8 +67,7 @@ def _handle_validation_error(value: Any, expected_type: str, name: str) -> None:
     Raises:
         TypeValidationError: With consistent error message
     """
-    logging.error(f"{name} must be a {expected_type}: {value}")
-    raise error.TypeValidationError(str(value), expected_type, name)
+    _raise_validation_error(error.TypeValidationError(str(value), expected_type, name))
 
 def _handle_format_error(value: Any, format_name: str, name: str) -> None:
     """
@@ -45,8 +81,7 @@ def _handle_format_error(value: Any, format_name: str, name: str) -> None:
     Raises:
         FormatValidationError: With consistent error message
     """
-    logging.error(f"{name} must be a valid {format_name}: {value}")
-    raise error.FormatValidationError(str(value), format_name, name)
+    _raise_validation_error(error.FormatValidationError(str(value), format_name, name))
 
 def _validate_with_pattern(value: str, pattern: Pattern[str], format_name: str, name: str) -> None:
     """
@@ -79,14 +114,44 @@ def validate_port(port: Union[str, int], name: str = "Port") -> None:
     Returns:
         None
     """
-    try:
-        port_int = int(port)
-        if port_int < 1 or port_int > 65535:
-            logging.error(f"{name} must be between 1 and 65535: {port}")
-            raise error.PortValidationError(str(port), name)
-    except ValueError:
-        logging.error(f"{name} must be a number: {port}")
-        raise error.TypeValidationError(str(port), "number", name)
+    # Integers (the common case) need no conversion
+    if isinstance(port, int):
+        port_int = port
+    else:
+        try:
+            port_int = int(port)
+        except ValueError:
+            _raise_validation_error(
+                error.TypeValidationError(str(port), "number", name)
+            )
+
+    if not 1 <= port_int <= 65535:
+        _raise_validation_error(error.PortValidationError(str(port), name))
+
+
+def validate_ports_batch(ports: Iterable[Union[str, int]], name: str = "Port") -> None:
+    """Validates that all port numbers of a sequence are within the valid range (1-65535).
+
+    Equivalent to calling validate_port for every element, but integer ports
+    are checked inline without a function call per port. Errors name the
+    index of the first offending port (e.g. "Port[2]").
+
+    Args:
+        ports: The port numbers to validate. Each can be a string or integer.
+        name: Name of the ports for error messages. Defaults to "Port".
+
+    Raises:
+        PortValidationError: If a port is not within the valid range (1-65535).
+        TypeValidationError: If a port cannot be converted to an integer.
+
+    Returns:
+        None
+    """
+    for index, port in enumerate(ports):
+        if isinstance(port, int) and 1 <= port <= 65535:
+            continue
+        validate_port(port, f"{name}[{index}]")
+
 
 def validate_is_decimal(value: Union[str, float], name: str = "Value") -> None:
     """Validates that a value can be converted to a decimal number.
@@ -101,6 +166,10 @@ def validate_is_decimal(value: Union[str, float], name: str = "Value") -> None:
     Returns:
         None
     """
+    # Numbers need no conversion
+    if type(value) is float or type(value) is int:
+        return
+
     try:
         float(value)
     except ValueError:
@@ -120,11 +189,14 @@ def validate_is_integer(value: Union[str, int], name: str = "Value") -> None:
     Returns:
         None
     """
+    # Integers need no conversion
+    if type(value) is int:
+        return
+
     try:
         int(value)
     except ValueError:
         _handle_validation_error(value, "integer", name)
-        raise error.TypeValidationError(str(value), "integer", name)
 
 
 def validate_is_boolean(value: Union[str, bool], name: str = "Value") -> None:
@@ -147,13 +219,13 @@ def validate_is_boolean(value: Union[str, bool], name: str = "Value") -> None:
     if isinstance(value, bool):
         return
 
-    if isinstance(value, str):
-        value_lower = value.lower()
-        if value_lower in ["true", "false", "yes", "no", "1", "0", "y", "n"]:
-            return
+    # Longest accepted string is "false"; skip lower() for anything longer
+    if isinstance(value, str) and len(value) <= 5 and value.lower() in _BOOLEAN_STRINGS:
+        return
 
-    logging.error(f"{name} must be a boolean value: {value}")
-    raise error.TypeValidationError(str(value), "boolean value", name)
+    _raise_validation_error(
+        error.TypeValidationError(str(value), "boolean value", name)
+    )
 
 
 # Compile regex patterns once at module level for efficiency
@@ -169,12 +241,134 @@ URL_PATTERN = re.compile(
 
 EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
+# Parts of EMAIL_PATTERN, matched separately after splitting at "@" and the last "."
+_EMAIL_LOCAL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+")
+_EMAIL_DOMAIN_PATTERN = re.compile(r"[a-zA-Z0-9.-]+")
+_EMAIL_TLD_PATTERN = re.compile(r"[a-zA-Z]{2,}")
+
+# Length limits of RFC 5321 (local part and complete address)
+_EMAIL_LOCAL_MAX_LENGTH = 64
+_EMAIL_MAX_LENGTH = 254
+
 HOSTNAME_PATTERN = re.compile(
     r"^[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$"
 )
 
 MEMORY_PATTERN = re.compile(r"^(\d+)([KMGTkmgt])[Bb]?$")
 
+
+def _is_dns_label(label: str) -> bool:
+    """
+    Check a DNS label as URL_PATTERN and HOSTNAME_PATTERN do.
+
+    A label has 1-63 characters, starts and ends with an alphanumeric
+    character and contains only alphanumerics and hyphens in between.
+
+    Args:
+        label: ASCII domain label without dots
+
+    Returns:
+        bool: True if the label is valid
+    """
+    return (
+        0 < len(label) <= 63
+        and label[0].isalnum()
+        and label[-1].isalnum()
+        and label.replace("-", "").isalnum()
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _match_url(value: str) -> bool:
+    """
+    Check a string against URL_PATTERN in a single linear pass.
+
+    The scanner accepts exactly the strings URL_PATTERN accepts, but without
+    the backtracking of the nested quantifiers. Non-ASCII input (where the
+    case-insensitive regex has Unicode-specific rules) is passed to the regex.
+
+    Args:
+        value: The string to check
+
+    Returns:
+        bool: True if the string is a valid URL
+    """
+    if not value.isascii():
+        return URL_PATTERN.match(value) is not None
+
+    # "$" also matches before a single trailing newline
+    if value.endswith("\n"):
+        value = value[:-1]
+
+    # Scheme
+    scheme, sep, rest = value.partition("://")
+    if not sep or scheme.lower() not in ("http", "https"):
+        return False
+
+    # Authority ends at the first "/" or "?"
+    end = len(rest)
+    for delimiter in "/?":
+        index = rest.find(delimiter, 0, end)
+        if index != -1:
+            end = index
+    authority, tail = rest[:end], rest[end:]
+
+    # Path/query: empty, "/" or "/" or "?" followed by non-whitespace
+    if tail not in ("", "/") and (
+        len(tail) < 2 or any(char.isspace() for char in tail[1:])
+    ):
+        return False
+
+    # Optional port
+    host, sep, port = authority.partition(":")
+    if sep and not (port and port.isdigit()):
+        return False
+
+    if host.lower() == "localhost":
+        return True
+
+    labels = host.split(".")
+
+    # Dotted quad (the pattern does not check the range of the octets)
+    if len(labels) == 4 and all(
+        0 < len(label) <= 3 and label.isdigit() for label in labels
+    ):
+        return True
+
+    # Domain: one or more labels followed by a top-level part, optional trailing dot
+    if labels[-1] == "":
+        labels.pop()
+    if len(labels) < 2:
+        return False
+    top_level = labels[-1]
+    return (
+        len(top_level) >= 2
+        and all(char.isalnum() or char == "-" for char in top_level)
+        and all(_is_dns_label(label) for label in labels[:-1])
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _match_hostname(value: str) -> bool:
+    """
+    Check a string against HOSTNAME_PATTERN with a per-label scan.
+
+    Args:
+        value: The string to check
+
+    Returns:
+        bool: True if the string is a valid hostname
+    """
+    if not value.isascii():
+        return False
+
+    # "$" also matches before a single trailing newline
+    if value.endswith("\n"):
+        value = value[:-1]
+
+    return all(_is_dns_label(label) for label in value.split("."))
+
+
 def validate_is_url(value: str, name: str = "URL") -> None:
     """Validates that a string is a valid URL.
 
@@ -191,14 +385,52 @@ def validate_is_url(value: str, name: str = "URL") -> None:
     Returns:
         None
     """
-    _validate_with_pattern(value, URL_PATTERN, "URL", name)
+    # Non-strings fail like a mismatch instead of raising AttributeError
+    if not isinstance(value, str) or not _match_url(value):
+        _handle_format_error(value, "URL", name)
+
+
+@functools.lru_cache(maxsize=1024)
+def _match_email(value: str) -> bool:
+    """
+    Check an email address without backtracking across its parts.
+
+    The address is split at "@" and at the last "." of the domain, and each
+    part is matched with a single-class pattern. Accepts what EMAIL_PATTERN
+    accepts, within the RFC 5321 length limits.
+
+    Args:
+        value: The string to check
+
+    Returns:
+        bool: True if the string is a valid email address
+    """
+    # "$" also matches before a single trailing newline
+    if value.endswith("\n"):
+        value = value[:-1]
+
+    if len(value) > _EMAIL_MAX_LENGTH:
+        return False
+
+    local, sep, domain = value.partition("@")
+    if not sep or len(local) > _EMAIL_LOCAL_MAX_LENGTH:
+        return False
+
+    host, sep, tld = domain.rpartition(".")
+    return bool(
+        sep
+        and _EMAIL_LOCAL_PATTERN.fullmatch(local)
+        and _EMAIL_DOMAIN_PATTERN.fullmatch(host)
+        and _EMAIL_TLD_PATTERN.fullmatch(tld)
+    )
 
 
 def validate_is_email(value: str, name: str = "Email") -> None:
     """Validates that a string is a valid email address.
 
     Checks if the string matches a standard email pattern with username,
-    @ symbol, and domain.
+    @ symbol, and domain. The local part may have at most 64 and the whole
+    address at most 254 characters (RFC 5321).
 
     Args:
         value: The string to validate as an email address.
@@ -210,13 +442,63 @@ def validate_is_email(value: str, name: str = "Email") -> None:
     Returns:
         None
     """
-    _validate_with_pattern(value, EMAIL_PATTERN, "email address", name)
+    # Non-strings fail like a mismatch instead of raising AttributeError
+    if not isinstance(value, str) or not _match_email(value):
+        _handle_format_error(value, "email address", name)
+
+
+def _is_ipv4(value: str) -> bool:
+    """
+    Check for a dotted-quad IPv4 address without going through ipaddress.
+
+    Only accepts what ipaddress.IPv4Address accepts (four ASCII decimal
+    octets 0-255 without leading zeros); anything else returns False so the
+    caller can fall back to the ipaddress module.
+
+    Args:
+        value: The string to check
+
+    Returns:
+        bool: True if the string is an IPv4 address
+    """
+    parts = value.split(".")
+    if len(parts) != 4:
+        return False
+    for part in parts:
+        if not (
+            0 < len(part) <= 3
+            and part.isascii()
+            and part.isdigit()
+            and (part[0] != "0" or part == "0")
+            and int(part) <= 255
+        ):
+            return False
+    return True
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_ip_address(value: str) -> bool:
+    """
+    Check an IP address string with the ipaddress module, memoized.
+
+    Args:
+        value: The string to check
+
+    Returns:
+        bool: True if the string is an IPv4 or IPv6 address
+    """
+    try:
+        ipaddress.ip_address(value)
+    except ValueError:
+        return False
+    return True
 
 
 def validate_is_ip_address(value: str, name: str = "IP address") -> None:
     """Validates that a string is a valid IP address (IPv4 or IPv6).
 
-    Uses the ipaddress module to validate the IP address format.
+    Dotted-quad IPv4 addresses are checked directly; other forms (IPv6)
+    are validated with the ipaddress module.
 
     Args:
         value: The string to validate as an IP address.
@@ -228,6 +510,11 @@ def validate_is_ip_address(value: str, name: str = "IP address") -> None:
     Returns:
         None
     """
+    if isinstance(value, str):
+        if not (_is_ipv4(value) or _is_ip_address(value)):
+            _handle_format_error(value, "IP address", name)
+        return
+
     try:
         ipaddress.ip_address(value)
     except ValueError:
@@ -237,7 +524,9 @@ def validate_is_ip_address(value: str, name: str = "IP address") -> None:
 def validate_is_ip_network(value: str, name: str = "IP network") -> None:
     """Validates that a string is a valid IP network (CIDR notation).
 
-    Uses the ipaddress module to validate the IP network format.
+    IPv4 networks with a prefix length are checked directly and values
+    without a prefix are checked as addresses; other forms (IPv6, netmask
+    notation) are validated with the ipaddress module.
     Accepts formats like "192.168.0.0/24" or "2001:db8::/32".
 
     Args:
@@ -250,6 +539,19 @@ def validate_is_ip_network(value: str, name: str = "IP network") -> None:
     Returns:
         None
     """
+    if isinstance(value, str):
+        address, sep, prefix = value.partition("/")
+        if _is_ipv4(address) and (
+            not sep or (prefix.isascii() and prefix.isdigit() and int(prefix) <= 32)
+        ):
+            return
+
+        # Without a prefix the network is a single address
+        if not sep:
+            if not _is_ip_address(value):
+                _handle_format_error(value, "IP network", name)
+            return
+
     try:
         ipaddress.ip_network(value, strict=False)
     except ValueError:
@@ -273,10 +575,101 @@ def validate_is_hostname(value: str, name: str = "Hostname") -> None:
     Returns:
         None
     """
-    _validate_with_pattern(value, HOSTNAME_PATTERN, "hostname", name)
+    # Non-strings fail like a mismatch instead of raising AttributeError
+    if not isinstance(value, str) or not _match_hostname(value):
+        _handle_format_error(value, "hostname", name)
 
 
-def _validate_filesystem_entity(value: str, check_func: Callable[[str], bool], entity_type: str, name: str) -> None:
+def validate_endpoint(value: str, name: str = "Endpoint") -> None:
+    """Validates that a string is a host:port endpoint.
+
+    The host can be an IPv4 address, a hostname, or an IPv6 address in
+    brackets (e.g. "[::1]:8080"); the port must be within 1-65535 and is
+    written without leading zeros. Both parts are checked in one pass without
+    calling the individual validators.
+
+    Args:
+        value: The string to validate as an endpoint.
+        name: Name of the value for error messages. Defaults to "Endpoint".
+
+    Raises:
+        FormatValidationError: If the value is not a valid endpoint.
+
+    Returns:
+        None
+    """
+    # Non-strings and newlines (the host scanners allow one at the end) fail early
+    if not isinstance(value, str) or "\n" in value:
+        _handle_format_error(value, "endpoint (host:port)", name)
+
+    host, sep, port = value.rpartition(":")
+
+    if host.startswith("[") and host.endswith("]"):
+        host_valid = ":" in host and _is_ip_address(host[1:-1])
+    else:
+        host_valid = _is_ipv4(host) or _match_hostname(host)
+
+    if not (
+        sep
+        and host_valid
+        and port.isascii()
+        and port.isdigit()
+        and port[0] != "0"
+        and int(port) <= 65535
+    ):
+        _handle_format_error(value, "endpoint (host:port)", name)
+
+
+# Positive filesystem checks by (check function, path), valid until the stored time.
+# Only used by callers that opt in with use_cache=True.
+_FS_CACHE: Dict[Tuple[Callable[[str], bool], str], float] = {}
+_FS_CACHE_TTL = 5.0  # Seconds
+_FS_CACHE_MAX_SIZE = 256
+
+
+def _check_path_cached(check_func: Callable[[str], bool], value: str) -> bool:
+    """
+    Run a filesystem check, reusing recent positive results for the same path.
+
+    Only successful checks are cached, so a path that is created later is
+    found immediately; a path that is removed may still pass for up to
+    _FS_CACHE_TTL seconds. Used only when a validator is called with
+    use_cache=True.
+
+    Args:
+        check_func: Function to check the path (e.g., os.path.isfile)
+        value: The path to check
+
+    Returns:
+        bool: Result of the check
+    """
+    key = (check_func, value)
+    now = time.monotonic()
+    expires = _FS_CACHE.get(key)
+    if expires is not None and expires > now:
+        return True
+
+    if not check_func(value):
+        return False
+
+    if len(_FS_CACHE) >= _FS_CACHE_MAX_SIZE:
+        _FS_CACHE.clear()
+    _FS_CACHE[key] = now + _FS_CACHE_TTL
+    return True
+
+
+def clear_fs_cache() -> None:
+    """Clears the cache of filesystem checks used with use_cache=True."""
+    _FS_CACHE.clear()
+
+
+def _validate_filesystem_entity(
+    value: str,
+    check_func: Callable[[str], bool],
+    entity_type: str,
+    name: str,
+    use_cache: bool = False,
+) -> None:
     """
     Validate a filesystem entity (file or directory).
     
@@ -285,13 +678,16 @@ def _validate_filesystem_entity(value: str, check_func: Callable[[str], bool], e
         check_func: Function to check if the path is valid (e.g., os.path.isfile)
         entity_type: Type of entity for error messages
         name: Name of the value for error messages
+        use_cache: Reuse positive results of the last _FS_CACHE_TTL seconds
     
     Raises:
         FileSystemValidationError: If validation fails
     """
-    if not check_func(value):
-        logging.error(f"{name} must be an existing {entity_type}: {value}")
-        raise error.FileSystemValidationError(value, entity_type, name)
+    valid = _check_path_cached(check_func, value) if use_cache else check_func(value)
+    if not valid:
+        _raise_validation_error(
+            error.FileSystemValidationError(value, entity_type, name)
+        )
 
 def validate_is_path(value: str, name: str = "Path") -> None:
     """Validates that a string is a valid file system path.
@@ -309,20 +705,28 @@ def validate_is_path(value: str, name: str = "Path") -> None:
     Returns:
         None
     """
+    # Anything that is not a path type fails without entering normpath
+    if not isinstance(value, (str, bytes, os.PathLike)):
+        _handle_format_error(value, "path", name)
+
     try:
         os.path.normpath(value)
-    except Exception:
+    except (TypeError, ValueError):
         _handle_format_error(value, "path", name)
 
 
-def validate_is_file(value: str, name: str = "File") -> None:
+def validate_is_file(value: str, name: str = "File", use_cache: bool = False) -> None:
     """Validates that a path points to an existing file.
 
-    Checks if the path exists and is a file (not a directory).
+    Checks if the path exists and is a file (not a directory). The check is
+    done on every call unless use_cache is set.
 
     Args:
         value: The path to validate.
         name: Name of the value for error messages. Defaults to "File".
+        use_cache: Reuse a successful check of the same path from the last
+            few seconds, so a file removed in the meantime may still pass.
+            Defaults to False.
 
     Raises:
         FileSystemValidationError: If the path does not exist or is not a file.
@@ -330,17 +734,23 @@ def validate_is_file(value: str, name: str = "File") -> None:
     Returns:
         None
     """
-    _validate_filesystem_entity(value, os.path.isfile, "file", name)
+    _validate_filesystem_entity(value, os.path.isfile, "file", name, use_cache)
 
 
-def validate_is_directory(value: str, name: str = "Directory") -> None:
+def validate_is_directory(
+    value: str, name: str = "Directory", use_cache: bool = False
+) -> None:
     """Validates that a path points to an existing directory.
 
-    Checks if the path exists and is a directory (not a file).
+    Checks if the path exists and is a directory (not a file). The check is
+    done on every call unless use_cache is set.
 
     Args:
         value: The path to validate.
         name: Name of the value for error messages. Defaults to "Directory".
+        use_cache: Reuse a successful check of the same path from the last
+            few seconds, so a directory removed in the meantime may still
+            pass. Defaults to False.
 
     Raises:
         FileSystemValidationError: If the path does not exist or is not a directory.
@@ -348,7 +758,121 @@ def validate_is_directory(value: str, name: str = "Directory") -> None:
     Returns:
         None
     """
-    _validate_filesystem_entity(value, os.path.isdir, "directory", name)
+    _validate_filesystem_entity(value, os.path.isdir, "directory", name, use_cache)
+
+
+def _validate_filesystem_batch(
+    paths: Iterable[str],
+    check_func: Callable[[str], bool],
+    entry_check: Callable[[os.DirEntry], bool],
+    entity_type: str,
+    name: str,
+    use_cache: bool = False,
+) -> None:
+    """
+    Validate several filesystem entities with one directory scan per parent directory.
+
+    Paths are grouped by their parent directory, and each directory is read
+    once with os.scandir. Paths that are not found in the scan (e.g. on
+    case-insensitive filesystems or in unreadable directories) are checked
+    individually with check_func, so the result matches a check per path.
+
+    Args:
+        paths: The paths to validate
+        check_func: Function to check a single path (e.g., os.path.isfile)
+        entry_check: Function to check a directory entry (e.g., os.DirEntry.is_file)
+        entity_type: Type of entity for error messages
+        name: Name of the paths for error messages
+        use_cache: Store positive results and reuse those of the last
+            _FS_CACHE_TTL seconds
+
+    Raises:
+        FileSystemValidationError: For the first path that fails validation
+    """
+    paths = list(paths)
+    split_paths = [os.path.split(path) for path in paths]
+
+    names_by_dir: Dict[str, Set[str]] = {}
+    for parent, base in split_paths:
+        names_by_dir.setdefault(parent, set()).add(base)
+
+    found = set()
+    for parent, names in names_by_dir.items():
+        try:
+            with os.scandir(parent or ".") as entries:
+                for entry in entries:
+                    if entry.name in names and entry_check(entry):
+                        found.add((parent, entry.name))
+        except OSError:
+            # Unreadable directory, the paths are checked individually
+            continue
+
+    now = time.monotonic()
+    for index, (path, split_path) in enumerate(zip(paths, split_paths)):
+        if split_path in found:
+            if use_cache:
+                if len(_FS_CACHE) >= _FS_CACHE_MAX_SIZE:
+                    _FS_CACHE.clear()
+                _FS_CACHE[(check_func, path)] = now + _FS_CACHE_TTL
+        elif not (
+            _check_path_cached(check_func, path) if use_cache else check_func(path)
+        ):
+            _raise_validation_error(
+                error.FileSystemValidationError(path, entity_type, f"{name}[{index}]")
+            )
+
+
+def validate_files_batch(
+    paths: Iterable[str], name: str = "File", use_cache: bool = False
+) -> None:
+    """Validates that all paths of a sequence point to existing files.
+
+    Equivalent to calling validate_is_file for every element, but files in
+    the same directory are looked up with a single directory scan instead of
+    one stat call each. Errors name the index of the first offending path
+    (e.g. "File[2]").
+
+    Args:
+        paths: The paths to validate.
+        name: Name of the paths for error messages. Defaults to "File".
+        use_cache: Reuse and store successful checks as validate_is_file
+            does with use_cache. Defaults to False.
+
+    Raises:
+        FileSystemValidationError: If a path does not exist or is not a file.
+
+    Returns:
+        None
+    """
+    _validate_filesystem_batch(
+        paths, os.path.isfile, os.DirEntry.is_file, "file", name, use_cache
+    )
+
+
+def validate_directories_batch(
+    paths: Iterable[str], name: str = "Directory", use_cache: bool = False
+) -> None:
+    """Validates that all paths of a sequence point to existing directories.
+
+    Equivalent to calling validate_is_directory for every element, but
+    directories with the same parent are looked up with a single directory
+    scan. Errors name the index of the first offending path (e.g. "Directory[2]").
+
+    Args:
+        paths: The paths to validate.
+        name: Name of the paths for error messages. Defaults to "Directory".
+        use_cache: Reuse and store successful checks as validate_is_directory
+            does with use_cache. Defaults to False.
+
+    Raises:
+        FileSystemValidationError: If a path does not exist or is not a directory.
+
+    Returns:
+        None
+    """
+    _validate_filesystem_batch(
+        paths, os.path.isdir, os.DirEntry.is_dir, "directory", name, use_cache
+    )
 
 
 def validate_is_in_list(
@@ -368,10 +892,21 @@ def validate_is_in_list(
         None
     """
     if value not in valid_values:
-        logging.error(
-            f"{name} must be one of the following values: {', '.join(map(str, valid_values))}"
-        )
-        raise error.ListValidationError(value, valid_values, name)
+        _raise_validation_error(error.ListValidationError(value, valid_values, name))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> Pattern[str]:
+    """
+    Compile a regex pattern once and cache it.
+
+    Args:
+        pattern: Regular expression pattern as a string
+
+    Returns:
+        Pattern[str]: Compiled pattern
+    """
+    return re.compile(pattern)
 
 
 def validate_matches_pattern(
@@ -380,7 +915,8 @@ def validate_matches_pattern(
     """Validates that a string matches a regular expression pattern.
 
     The pattern can be provided as a string or a compiled regex pattern.
-    If a string is provided, it will be compiled into a pattern.
+    If a string is provided, it will be compiled into a pattern and cached;
+    compiled patterns are used as they are.
 
     Args:
         value: The string to validate.
@@ -394,11 +930,10 @@ def validate_matches_pattern(
         None
     """
     if isinstance(pattern, str):
-        pattern = re.compile(pattern)
+        pattern = _compile_pattern(pattern)
 
     if not pattern.match(value):
-        logging.error(f"{name} must match the pattern {pattern.pattern}: {value}")
-        raise error.PatternValidationError(value, pattern, name)
+        _raise_validation_error(error.PatternValidationError(value, pattern, name))
 
 
 def validate_length(
@@ -427,12 +962,71 @@ def validate_length(
     length = len(value)
 
     if min_length is not None and length < min_length:
-        logging.error(f"{name} must be at least {min_length} characters long: {value}")
-        raise error.LengthValidationError(value, min_length, max_length, name)
+        _raise_validation_error(
+            error.LengthValidationError(value, min_length, max_length, name)
+        )
 
     if max_length is not None and length > max_length:
-        logging.error(f"{name} must be at most {max_length} characters long: {value}")
-        raise error.LengthValidationError(value, min_length, max_length, name)
+        _raise_validation_error(
+            error.LengthValidationError(value, min_length, max_length, name)
+        )
+
+
+def make_length_validator(
+    min_length: Optional[int] = None,
+    max_length: Optional[int] = None,
+    name: str = "Value",
+) -> Callable[[Sized], None]:
+    """Creates a length validator with fixed bounds.
+
+    The returned function behaves like validate_length with the given bounds,
+    but decides once which bounds are set instead of on every call. Useful
+    when the same length constraint is checked repeatedly.
+
+    Args:
+        min_length: Minimum required length. If None, no minimum is enforced.
+        max_length: Maximum allowed length. If None, no maximum is enforced.
+        name: Name of the value for error messages. Defaults to "Value".
+
+    Returns:
+        Callable[[Sized], None]: Function that validates the length of a value
+            and raises LengthValidationError if it is outside the bounds.
+    """
+
+    def fail(value: Sized) -> NoReturn:
+        _raise_validation_error(
+            error.LengthValidationError(value, min_length, max_length, name)
+        )
+
+    if min_length is not None and max_length is not None:
+
+        def check_both(value: Sized) -> None:
+            if not min_length <= len(value) <= max_length:
+                fail(value)
+
+        return check_both
+
+    if min_length is not None:
+
+        def check_min(value: Sized) -> None:
+            if len(value) < min_length:
+                fail(value)
+
+        return check_min
+
+    if max_length is not None:
+
+        def check_max(value: Sized) -> None:
+            if len(value) > max_length:
+                fail(value)
+
+        return check_max
+
+    def check_none(value: Sized) -> None:
+        # No bounds; like validate_length, still require a sized value
+        len(value)
+
+    return check_none
 
 
 def validate_range(
@@ -459,20 +1053,77 @@ def validate_range(
     Returns:
         None
     """
-    try:
-        value_float = float(value)
+    # Numbers are compared directly, only other types need a conversion
+    if type(value) is int or type(value) is float:
+        value_number = value
+    else:
+        try:
+            value_number = float(value)
+        except ValueError:
+            _raise_validation_error(
+                error.TypeValidationError(str(value), "number", name)
+            )
+
+    if min_value is not None and value_number < min_value:
+        _raise_validation_error(
+            error.RangeValidationError(str(value), min_value, max_value, name)
+        )
 
-        if min_value is not None and value_float < min_value:
-            logging.error(f"{name} must be at least {min_value}: {value}")
-            raise error.RangeValidationError(str(value), min_value, max_value, name)
+    if max_value is not None and value_number > max_value:
+        _raise_validation_error(
+            error.RangeValidationError(str(value), min_value, max_value, name)
+        )
 
-        if max_value is not None and value_float > max_value:
-            logging.error(f"{name} must be at most {max_value}: {value}")
-            raise error.RangeValidationError(str(value), min_value, max_value, name)
 
-    except ValueError:
-        logging.error(f"{name} must be a number: {value}")
-        raise error.TypeValidationError(str(value), "number", name)
+def validate_range_array(
+    values: Iterable[Union[int, float, str]],
+    min_value: Optional[Union[int, float]] = None,
+    max_value: Optional[Union[int, float]] = None,
+    name: str = "Values",
+) -> None:
+    """Validates that all numeric values of a sequence are within specified bounds.
+
+    Equivalent to calling validate_range for every element, but the bounds are
+    resolved once and the values are checked in a single loop. Errors name the
+    index of the first offending element (e.g. "Values[3]").
+
+    Args:
+        values: The numeric values to validate.
+        min_value: Minimum allowed value. If None, no minimum is enforced.
+        max_value: Maximum allowed value. If None, no maximum is enforced.
+        name: Name of the values for error messages. Defaults to "Values".
+
+    Raises:
+        TypeValidationError: If a value cannot be converted to a float.
+        RangeValidationError: If a value is outside the specified bounds.
+
+    Returns:
+        None
+    """
+    lower = float("-inf") if min_value is None else min_value
+    upper = float("inf") if max_value is None else max_value
+
+    for index, value in enumerate(values):
+        try:
+            value_float = float(value)
+        except ValueError:
+            _raise_validation_error(
+                error.TypeValidationError(str(value), "number", f"{name}[{index}]")
+            )
+
+        if value_float < lower:
+            _raise_validation_error(
+                error.RangeValidationError(
+                    str(value), min_value, max_value, f"{name}[{index}]"
+                )
+            )
+
+        if value_float > upper:
+            _raise_validation_error(
+                error.RangeValidationError(
+                    str(value), min_value, max_value, f"{name}[{index}]"
+                )
+            )
 
 
 def validate_with_function(
@@ -500,8 +1151,7 @@ def validate_with_function(
         None
     """
     if not validation_func(value):
-        logging.error(f"{name}: {error_message}")
-        raise error.CustomValidationError(error_message, name)
+        _raise_validation_error(error.CustomValidationError(error_message, name))
 
 
 def validate_all(validations: List[Tuple[Callable[..., None], List[Any], Dict[str, Any]]]) -> None:
@@ -527,6 +1177,37 @@ def validate_all(validations: List[Tuple[Callable[..., None], List[Any], Dict[st
         validation_func(*args, **kwargs)
 
 
+def compile_validations(
+    validations: List[Tuple[Callable[..., None], List[Any], Dict[str, Any]]]
+) -> Callable[[], None]:
+    """Prepares a list of validations for repeated execution.
+
+    The arguments of each validation are bound once with functools.partial,
+    so calling the returned function does not unpack the argument lists and
+    keyword dictionaries again. Like validate_all, all validations must pass.
+
+    Args:
+        validations: List of tuples containing:
+            - validation function
+            - list of positional arguments for the function
+            - dictionary of keyword arguments for the function
+
+    Returns:
+        Callable[[], None]: Function that runs all validations in sequence and
+            raises the first error encountered
+    """
+    bound_validations = tuple(
+        functools.partial(validation_func, *args, **kwargs)
+        for validation_func, args, kwargs in validations
+    )
+
+    def run_validations() -> None:
+        for validation in bound_validations:
+            validation()
+
+    return run_validations
+
+
 def validate_any(validations: List[Tuple[Callable[..., None], List[Any], Dict[str, Any]]]) -> None:
     """Performs multiple validations and requires at least one to pass.
 
@@ -546,18 +1227,49 @@ def validate_any(validations: List[Tuple[Callable[..., None], List[Any], Dict[st
     Returns:
         None
     """
-    errors = []
-    
-    for validation_func, args, kwargs in validations:
-        try:
-            validation_func(*args, **kwargs)
-            return  # If any validation succeeds, return immediately
-        except error.ValidationError as e:
-            errors.append(str(e))
-    
+    errors: List[error.ValidationError] = []
+
+    # Failed alternatives are expected here, so they are not logged individually
+    _quiet.depth = getattr(_quiet, "depth", 0) + 1
+    try:
+        for validation_func, args, kwargs in validations:
+            try:
+                validation_func(*args, **kwargs)
+                return  # If any validation succeeds, return immediately
+            except error.ValidationError as e:
+                # Keep the exception, it is only converted to text if all validations fail
+                errors.append(e)
+    finally:
+        _quiet.depth -= 1
+
     # If we get here, all validations failed
-    logging.error("None of the validations were successful")
-    raise error.ValidationError(f"All validations failed: {'; '.join(errors)}")
+    if not _quiet.depth:
+        logging.error("None of the validations were successful")
+    raise error.ValidationError(
+        f"All validations failed: {'; '.join(str(e) for e in errors)}"
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _match_memory(value: str) -> bool:
+    """
+    Check a string against MEMORY_PATTERN by slicing off unit and suffix.
+
+    Args:
+        value: The string to check
+
+    Returns:
+        bool: True if the string is a valid memory size
+    """
+    # "$" also matches before a single trailing newline
+    if value.endswith("\n"):
+        value = value[:-1]
+
+    # Optional "B"/"b" suffix, then exactly one unit character after the digits
+    if value[-1:] in ("B", "b"):
+        value = value[:-1]
+    unit = value[-1:]
+    return unit != "" and unit in "KMGTkmgt" and value[:-1].isdecimal()
 
 
 def validate_memory_format(value: str, name: str = "Memory value") -> None:
@@ -577,7 +1289,8 @@ def validate_memory_format(value: str, name: str = "Memory value") -> None:
     Returns:
         None
     """
-    if not MEMORY_PATTERN.match(value):
+    # Non-strings fail like a mismatch instead of raising AttributeError
+    if not isinstance(value, str) or not _match_memory(value):
         _handle_format_error(value, "memory format (e.g., '16G' or '512M')", name)
 
 
@@ -598,13 +1311,30 @@ def validate_cpu_format(value: Union[str, float, int], name: str = "CPU value")
     Returns:
         None
     """
-    try:
-        cpu_value = float(value)
-        if cpu_value <= 0:
-            logging.error(f"{name} must be greater than 0: {value}")
-            raise error.RangeValidationError(str(value), 0, None, name)
-    except ValueError:
-        _handle_validation_error(value, "decimal number", name)
+    # Numbers need no conversion
+    if type(value) is int or type(value) is float:
+        cpu_value = value
+    else:
+        try:
+            cpu_value = float(value)
+        except ValueError:
+            _handle_validation_error(value, "decimal number", name)
+
+    if cpu_value <= 0:
+        _raise_validation_error(error.RangeValidationError(str(value), 0, None, name))
+
+
+def clear_validation_caches() -> None:
+    """Clears the memoized results of the format validators and filesystem checks."""
+    for cached_check in (
+        _match_url,
+        _match_hostname,
+        _match_email,
+        _match_memory,
+        _is_ip_address,
+    ):
+        cached_check.cache_clear()
+    clear_fs_cache()
 
 
 logging.debug("Validation module initialized")
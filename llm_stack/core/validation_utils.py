@@ -31,92 +31,105 @@ Examples:
     ```
 """
 
+import json
 import os
 import re
 import functools
+import threading
 import concurrent.futures
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union, Any, Set, Callable
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union, Any, Set
 
 import yaml
 
 from llm_stack.core import logging
-from llm_stack.core.file_utils import read_file, parse_env_file
+from llm_stack.core.file_utils import parse_env_file
+
+# Use the libyaml C bindings for parsing if PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
 
 # Compile regex patterns once at module level for better performance
 URL_PATTERN = re.compile(r'^(https?|ftp)://[^\s/$.?#].[^\s]*$')
 EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 MEMORY_PATTERN = re.compile(r'^(\d+)([KMG]B?|[kmg]b?)?$')
 
-# Cache for file existence checks to avoid redundant filesystem operations
-_file_exists_cache = {}
-_dir_exists_cache = {}
+# Parts of EMAIL_PATTERN, matched separately after splitting at "@" and the last "."
+_EMAIL_LOCAL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+')
+_EMAIL_DOMAIN_PATTERN = re.compile(r'[a-zA-Z0-9.-]+')
+_EMAIL_TLD_PATTERN = re.compile(r'[a-zA-Z]{2,}')
+
+# Schemes accepted by URL_PATTERN
+_URL_SCHEMES = ("http", "https", "ftp")
+
+# Characters URL_PATTERN does not allow directly after the scheme
+_URL_INVALID_START = "/$.?#"
+
+# Units accepted by MEMORY_PATTERN, alone and with the byte suffix
+_MEMORY_UNITS = frozenset("KMGkmg")
+_MEMORY_UNITS_WITH_SUFFIX = frozenset(("KB", "MB", "GB", "kb", "mb", "gb"))
+
+# Strings accepted by validate_boolean (lower case)
+_BOOLEAN_VALUES = frozenset(("true", "false", "yes", "no", "1", "0"))
+
+# Parsed .env files by (path, mtime, size), least recently used first
+_env_parse_cache: "OrderedDict[Tuple[str, int, int], Dict[str, str]]" = OrderedDict()
+_env_parse_cache_lock = threading.Lock()
+_ENV_PARSE_CACHE_MAX_SIZE = 128
 
 
-# Cache decorator for validation functions
-def cache_validation_result(func: Callable) -> Callable:
+def _fail(message: str, *args: Any) -> bool:
     """
-    Cache validation results to avoid redundant validations.
-    
-    This decorator caches the results of validation functions to avoid
-    redundant validations, which can be particularly useful for filesystem
-    operations that are relatively expensive. The cache has a size limit
-    to prevent memory issues, and it automatically removes the oldest
-    entries when the limit is reached.
-    
+    Log a validation error and return False.
+
     Args:
-        func: Function to decorate. The function should take at least one
-            argument that can be used as a cache key.
-        
+        message: %-format string of the error message
+        *args: Arguments for the message, formatted only if the error is logged
+
     Returns:
-        Callable: Decorated function with caching capability
-        
-    Example:
-        ```python
-        @cache_validation_result
-        def validate_file_exists(file_path: str) -> bool:
-            return os.path.isfile(file_path)
-        ```
+        bool: Always False
     """
-    cache = {}
-    
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        # Create a cache key from the function name and arguments
-        key = (func.__name__, args[0] if args else None)
-        
-        # Check cache
-        if key in cache:
-            return cache[key]
-        
-        # Call original function
-        result = func(*args, **kwargs)
-        
-        # Update cache
-        cache[key] = result
-        
-        # Limit cache size
-        if len(cache) > 1000:
-            # Remove oldest 20% of entries
-            oldest_keys = sorted(cache.keys())[:len(cache)//5]
-            for old_key in oldest_keys:
-                del cache[old_key]
-                
-        return result
-    
-    # Add method to clear cache
-    wrapper.clear_cache = lambda: cache.clear()
-    
-    return wrapper
+    logging.error(message, *args)
+    return False
+
+
+@functools.lru_cache(maxsize=1024)
+def _file_exists(file_path: str) -> bool:
+    """
+    Check whether a file exists, memoized per path.
+
+    Args:
+        file_path: Path to the file to check
+
+    Returns:
+        bool: True if the file exists
+    """
+    return os.path.isfile(file_path)
+
+
+@functools.lru_cache(maxsize=1024)
+def _directory_exists(directory_path: str) -> bool:
+    """
+    Check whether a directory exists, memoized per path.
+
+    Args:
+        directory_path: Path to the directory to check
+
+    Returns:
+        bool: True if the directory exists
+    """
+    return os.path.isdir(directory_path)
+
 
-@cache_validation_result
 def validate_file_exists(file_path: str) -> bool:
     """
     Validate that a file exists with caching.
 
     This function checks if a file exists at the specified path and caches
     the result to avoid redundant filesystem operations. If the file does
-    not exist, an error message is logged.
+    not exist, an error message is logged on every call.
 
     Args:
         file_path: Path to the file to check
@@ -136,35 +149,18 @@ def validate_file_exists(file_path: str) -> bool:
             pass
         ```
     """
-    # Use global cache for file existence checks
-    global _file_exists_cache
-    
-    # Check cache first
-    if file_path in _file_exists_cache:
-        if not _file_exists_cache[file_path]:
-            logging.error(f"File not found: {file_path}")
-        return _file_exists_cache[file_path]
-    
-    # Check file existence
-    result = os.path.isfile(file_path)
-    
-    # Update cache
-    _file_exists_cache[file_path] = result
-    
-    if not result:
-        logging.error(f"File not found: {file_path}")
-        
-    return result
+    if _file_exists(file_path):
+        return True
+    return _fail("File not found: %s", file_path)
 
 
-@cache_validation_result
 def validate_directory_exists(directory_path: str) -> bool:
     """
     Validate that a directory exists with caching.
 
     This function checks if a directory exists at the specified path and caches
     the result to avoid redundant filesystem operations. If the directory does
-    not exist, an error message is logged.
+    not exist, an error message is logged on every call.
 
     Args:
         directory_path: Path to the directory to check
@@ -184,25 +180,17 @@ def validate_directory_exists(directory_path: str) -> bool:
             pass
         ```
     """
-    # Use global cache for directory existence checks
-    global _dir_exists_cache
-    
-    # Check cache first
-    if directory_path in _dir_exists_cache:
-        if not _dir_exists_cache[directory_path]:
-            logging.error(f"Directory not found: {directory_path}")
-        return _dir_exists_cache[directory_path]
-    
-    # Check directory existence
-    result = os.path.isdir(directory_path)
-    
-    # Update cache
-    _dir_exists_cache[directory_path] = result
-    
-    if not result:
-        logging.error(f"Directory not found: {directory_path}")
-        
-    return result
+    if _directory_exists(directory_path):
+        return True
+    return _fail("Directory not found: %s", directory_path)
+
+
+# Clear the cached filesystem checks (e.g. in tests); clear_cache is the
+# original name and kept for existing callers
+validate_file_exists.cache_clear = _file_exists.cache_clear
+validate_file_exists.clear_cache = _file_exists.cache_clear
+validate_directory_exists.cache_clear = _directory_exists.cache_clear
+validate_directory_exists.clear_cache = _directory_exists.cache_clear
 
 
 def validate_port(port_value: str, variable_name: str = "port") -> bool:
@@ -232,15 +220,18 @@ def validate_port(port_value: str, variable_name: str = "port") -> bool:
             pass
         ```
     """
-    try:
-        port = int(port_value)
-        if port < 1 or port > 65535:
-            logging.error(f"Invalid {variable_name}: {port_value} (must be between 1 and 65535)")
-            return False
-        return True
-    except ValueError:
-        logging.error(f"Invalid {variable_name}: {port_value} (must be an integer)")
-        return False
+    # Integers need no conversion
+    if type(port_value) is int:
+        port = port_value
+    else:
+        try:
+            port = int(port_value)
+        except ValueError:
+            return _fail("Invalid %s: %s (must be an integer)", variable_name, port_value)
+
+    if not 1 <= port <= 65535:
+        return _fail("Invalid %s: %s (must be between 1 and 65535)", variable_name, port_value)
+    return True
 
 
 def validate_cpu_format(cpu_value: str, variable_name: str = "CPU limit") -> bool:
@@ -271,26 +262,53 @@ def validate_cpu_format(cpu_value: str, variable_name: str = "CPU limit") -> boo
             pass
         ```
     """
-    try:
-        # CPU limit can be a float (e.g., 0.5) or an integer
-        cpu = float(cpu_value)
-        if cpu <= 0:
-            logging.error(f"Invalid {variable_name}: {cpu_value} (must be positive)")
-            return False
-        return True
-    except ValueError:
-        logging.error(f"Invalid {variable_name}: {cpu_value} (must be a number)")
-        return False
+    # CPU limit can be a float (e.g., 0.5) or an integer
+    if type(cpu_value) in (int, float):
+        cpu = cpu_value
+    else:
+        try:
+            cpu = float(cpu_value)
+        except ValueError:
+            return _fail("Invalid %s: %s (must be a number)", variable_name, cpu_value)
+
+    if cpu <= 0:
+        return _fail("Invalid %s: %s (must be positive)", variable_name, cpu_value)
+    return True
+
+
+def _match_memory(memory_value: str) -> bool:
+    """
+    Check a string against MEMORY_PATTERN by slicing off the unit.
+
+    Accepts exactly the strings MEMORY_PATTERN accepts: decimal digits,
+    optionally followed by K, M or G (with an optional B of the same case).
+
+    Args:
+        memory_value: Memory value to check
+
+    Returns:
+        bool: True if the memory value matches MEMORY_PATTERN
+    """
+    # "$" also matches before a single trailing newline
+    if memory_value.endswith("\n"):
+        memory_value = memory_value[:-1]
+
+    if memory_value[-2:] in _MEMORY_UNITS_WITH_SUFFIX:
+        memory_value = memory_value[:-2]
+    elif memory_value[-1:] in _MEMORY_UNITS:
+        memory_value = memory_value[:-1]
+
+    return memory_value.isdecimal()
 
 
 def validate_memory_format(memory_value: str, variable_name: str = "memory limit") -> bool:
     """
-    Validate a memory limit format using pre-compiled regex pattern.
+    Validate a memory limit format.
 
     This function checks if a memory limit value is valid (a number followed by
-    an optional unit K, M, or G). The validation uses a pre-compiled regex pattern
-    for better performance. If the memory limit is invalid, an error message is
-    logged with the provided variable name.
+    an optional unit K, M, or G). The unit is sliced off and the rest is checked
+    for digits, without running MEMORY_PATTERN. If the memory limit is invalid,
+    an error message is logged with the provided variable name.
 
     Args:
         memory_value: Memory limit value to validate (as a string, e.g., "512M", "4G")
@@ -312,25 +330,52 @@ def validate_memory_format(memory_value: str, variable_name: str = "memory limit
             pass
         ```
     """
-    # Use pre-compiled pattern for better performance
-    match = MEMORY_PATTERN.match(memory_value)
-    
-    if not match:
-        logging.error(
-            f"Invalid {variable_name}: {memory_value} "
-            "(must be a number followed by an optional unit K, M, or G)"
+    if not _match_memory(memory_value):
+        return _fail(
+            "Invalid %s: %s (must be a number followed by an optional unit K, M, or G)",
+            variable_name,
+            memory_value,
         )
-        return False
     
     return True
 
 
+def _match_url(url_value: str) -> bool:
+    """
+    Check a string against URL_PATTERN without running the regex.
+
+    The scheme is split off at the first "://" and the rest is checked with
+    plain string operations. Accepts exactly the strings URL_PATTERN accepts.
+
+    Args:
+        url_value: URL value to check
+
+    Returns:
+        bool: True if the URL matches URL_PATTERN
+    """
+    # "$" also matches before a single trailing newline
+    if url_value.endswith("\n"):
+        url_value = url_value[:-1]
+
+    scheme, sep, rest = url_value.partition("://")
+    if not sep or scheme not in _URL_SCHEMES or len(rest) < 2:
+        return False
+
+    first = rest[0]
+    return (
+        not first.isspace()
+        and first not in _URL_INVALID_START
+        and rest[1] != "\n"
+        and not any(char.isspace() for char in rest[2:])
+    )
+
+
 def validate_url(url_value: str, variable_name: str = "URL") -> bool:
     """
-    Validate a URL format using pre-compiled regex pattern.
+    Validate a URL format.
 
-    This function checks if a URL value is valid using a pre-compiled regex pattern
-    for better performance. The URL must start with http://, https://, or ftp://.
+    This function checks if a URL value matches URL_PATTERN using a linear string
+    scan instead of the regex. The URL must start with http://, https://, or ftp://.
     If the URL is invalid, an error message is logged with the provided variable name.
 
     Args:
@@ -353,21 +398,50 @@ def validate_url(url_value: str, variable_name: str = "URL") -> bool:
             pass
         ```
     """
-    # Use pre-compiled pattern for better performance
-    if not URL_PATTERN.match(url_value):
-        logging.error(f"Invalid {variable_name}: {url_value} (must be a valid URL)")
-        return False
+    if not _match_url(url_value):
+        return _fail("Invalid %s: %s (must be a valid URL)", variable_name, url_value)
     
     return True
 
 
+def _match_email(email_value: str) -> bool:
+    """
+    Check a string against EMAIL_PATTERN without backtracking across its parts.
+
+    The address is split at the first "@" and at the last "." of the domain,
+    and each part is matched with a single-class pattern. Accepts exactly the
+    strings EMAIL_PATTERN accepts.
+
+    Args:
+        email_value: Email value to check
+
+    Returns:
+        bool: True if the email matches EMAIL_PATTERN
+    """
+    # "$" also matches before a single trailing newline
+    if email_value.endswith("\n"):
+        email_value = email_value[:-1]
+
+    local, sep, domain = email_value.partition("@")
+    if not sep:
+        return False
+
+    host, sep, tld = domain.rpartition(".")
+    return bool(
+        sep
+        and _EMAIL_LOCAL_PATTERN.fullmatch(local)
+        and _EMAIL_DOMAIN_PATTERN.fullmatch(host)
+        and _EMAIL_TLD_PATTERN.fullmatch(tld)
+    )
+
+
 def validate_email(email_value: str, variable_name: str = "email") -> bool:
     """
-    Validate an email format using pre-compiled regex pattern.
+    Validate an email format.
 
-    This function checks if an email value is valid using a pre-compiled regex pattern
-    for better performance. If the email is invalid, an error message is logged with
-    the provided variable name.
+    This function checks if an email value matches EMAIL_PATTERN by splitting it
+    into local part, domain and top-level domain first. If the email is invalid,
+    an error message is logged with the provided variable name.
 
     Args:
         email_value: Email value to validate (as a string)
@@ -389,10 +463,8 @@ def validate_email(email_value: str, variable_name: str = "email") -> bool:
             pass
         ```
     """
-    # Use pre-compiled pattern for better performance
-    if not EMAIL_PATTERN.match(email_value):
-        logging.error(f"Invalid {variable_name}: {email_value} (must be a valid email)")
-        return False
+    if not _match_email(email_value):
+        return _fail("Invalid %s: %s (must be a valid email)", variable_name, email_value)
     
     return True
 
@@ -426,14 +498,12 @@ def validate_boolean(bool_value: str, variable_name: str = "boolean") -> bool:
             pass
         ```
     """
-    valid_values = ['true', 'false', 'yes', 'no', '1', '0']
-    
-    if bool_value.lower() not in valid_values:
-        logging.error(
-            f"Invalid {variable_name}: {bool_value} "
-            "(must be one of: true, false, yes, no, 1, 0)"
+    if bool_value.lower() not in _BOOLEAN_VALUES:
+        return _fail(
+            "Invalid %s: %s (must be one of: true, false, yes, no, 1, 0)",
+            variable_name,
+            bool_value,
         )
-        return False
     
     return True
 
@@ -466,31 +536,67 @@ def validate_env_file(env_file: str) -> bool:
             print("Environment file is invalid")
         ```
     """
-    logging.debug(f"Validating .env file: {env_file}")
+    logging.debug("Validating .env file: %s", env_file)
     
     # Check if the file exists
     if not validate_file_exists(env_file):
         return False
     
-    # Parse the environment file
+    return _check_env_file(env_file)
+
+
+def _parse_env_file_cached(env_file: str) -> Dict[str, str]:
+    """
+    Parse an environment file, reusing the result while the file is unchanged.
+
+    Args:
+        env_file: Path to the environment file
+
+    Returns:
+        Dict[str, str]: Dictionary of environment variables
+    """
+    try:
+        stat_result = os.stat(env_file)
+    except OSError:
+        return parse_env_file(env_file)
+
+    key = (os.path.abspath(env_file), stat_result.st_mtime_ns, stat_result.st_size)
+    with _env_parse_cache_lock:
+        variables = _env_parse_cache.get(key)
+        if variables is not None:
+            _env_parse_cache.move_to_end(key)
+            return variables
+
     variables = parse_env_file(env_file)
+
+    with _env_parse_cache_lock:
+        _env_parse_cache[key] = variables
+        if len(_env_parse_cache) > _ENV_PARSE_CACHE_MAX_SIZE:
+            _env_parse_cache.popitem(last=False)
+
+    return variables
+
+
+def _check_env_file(env_file: str) -> bool:
+    """
+    Validate the variables of an existing environment file.
+
+    Args:
+        env_file: Path to the environment file to validate
+
+    Returns:
+        bool: True if the file is valid, False otherwise
+    """
+    # Parse the environment file (cached while it is unchanged)
+    variables = _parse_env_file_cached(env_file)
     
-    # Validate port variables
-    port_vars = [var for var in variables if var.startswith("HOST_PORT_")]
-    for var in port_vars:
-        if not validate_port(variables[var], var):
+    # Validate port, CPU limit and memory limit variables in a single pass
+    for var, value in variables.items():
+        if var.startswith("HOST_PORT_") and not validate_port(value, var):
             return False
-    
-    # Validate CPU limit variables
-    cpu_vars = [var for var in variables if var.endswith("_CPU_LIMIT")]
-    for var in cpu_vars:
-        if not validate_cpu_format(variables[var], var):
+        if var.endswith("_CPU_LIMIT") and not validate_cpu_format(value, var):
             return False
-    
-    # Validate memory limit variables
-    memory_vars = [var for var in variables if var.endswith("_MEMORY_LIMIT")]
-    for var in memory_vars:
-        if not validate_memory_format(variables[var], var):
+        if var.endswith("_MEMORY_LIMIT") and not validate_memory_format(value, var):
             return False
     
     logging.success(f".env file validated: {env_file}")
@@ -525,35 +631,45 @@ def validate_yaml_file(yaml_file: str) -> bool:
             print("YAML file is invalid")
         ```
     """
-    logging.debug(f"Validating YAML file: {yaml_file}")
+    logging.debug("Validating YAML file: %s", yaml_file)
     
     # Check if the file exists
     if not validate_file_exists(yaml_file):
         return False
     
-    # Parse the YAML file
-    success, content = read_file(yaml_file)
-    if not success:
-        return False
-    
+    return _check_yaml_file(yaml_file)
+
+
+def _check_yaml_file(yaml_file: str) -> bool:
+    """
+    Validate the content of an existing YAML file.
+
+    Args:
+        yaml_file: Path to the YAML file to validate
+
+    Returns:
+        bool: True if the file is valid, False otherwise
+    """
     try:
-        yaml_data = yaml.safe_load(content)
+        # Parse the YAML file straight from the open file
+        with open(yaml_file, "r") as f:
+            yaml_data = yaml.load(f, Loader=_YamlSafeLoader)
         
         # Check if the file contains valid YAML
         if yaml_data is None:
-            logging.error(f"Empty YAML file: {yaml_file}")
-            return False
+            return _fail("Empty YAML file: %s", yaml_file)
         
         logging.success(f"YAML file validated: {yaml_file}")
         return True
     
     except yaml.YAMLError as e:
-        logging.error(f"Invalid YAML in {yaml_file}: {str(e)}")
-        return False
+        return _fail("Invalid YAML in %s: %s", yaml_file, e)
+    
+    except OSError as e:
+        return _fail("Error reading file %s: %s", yaml_file, e)
     
     except Exception as e:
-        logging.error(f"Error validating YAML file: {str(e)}")
-        return False
+        return _fail("Error validating YAML file: %s", e)
 
 
 def validate_json_file(json_file: str) -> bool:
@@ -583,34 +699,86 @@ def validate_json_file(json_file: str) -> bool:
             print("JSON file is invalid")
         ```
     """
-    logging.debug(f"Validating JSON file: {json_file}")
+    logging.debug("Validating JSON file: %s", json_file)
     
     # Check if the file exists
     if not validate_file_exists(json_file):
         return False
     
-    # Parse the JSON file
-    success, content = read_file(json_file)
-    if not success:
-        return False
-    
+    return _check_json_file(json_file)
+
+
+def _check_json_file(json_file: str) -> bool:
+    """
+    Validate the content of an existing JSON file.
+
+    Args:
+        json_file: Path to the JSON file to validate
+
+    Returns:
+        bool: True if the file is valid, False otherwise
+    """
     try:
-        import json
-        json.loads(content)
+        # Parse the JSON file straight from the open file
+        with open(json_file, "r") as f:
+            json.load(f)
         
         logging.success(f"JSON file validated: {json_file}")
         return True
     
     except json.JSONDecodeError as e:
-        logging.error(f"Invalid JSON in {json_file}: {str(e)}")
-        return False
+        return _fail("Invalid JSON in %s: %s", json_file, e)
+    
+    except OSError as e:
+        return _fail("Error reading file %s: %s", json_file, e)
     
     except Exception as e:
-        logging.error(f"Error validating JSON file: {str(e)}")
-        return False
+        return _fail("Error validating JSON file: %s", e)
+
+
+def _collect_config_files(config_dir: str) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Collect the configuration files below a directory with one os.scandir walk.
+
+    File types come from the directory entries, so no extra stat call is
+    needed per file. Symlinked directories are not followed and unreadable
+    directories are skipped, like Path.glob("**/...").
 
+    Args:
+        config_dir: Path to the configuration directory
 
-def validate_config_directory(config_dir: str, max_workers: int = 4) -> bool:
+    Returns:
+        Tuple[List[str], List[str], List[str]]: Paths of the .env, .yml/.yaml
+            and .json files
+    """
+    env_files: List[str] = []
+    yaml_files: List[str] = []
+    json_files: List[str] = []
+
+    pending = [config_dir]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif not entry.is_file():
+                        continue
+                    elif entry.name.endswith(".env"):
+                        env_files.append(entry.path)
+                    elif entry.name.endswith((".yml", ".yaml")):
+                        yaml_files.append(entry.path)
+                    elif entry.name.endswith(".json"):
+                        json_files.append(entry.path)
+        except PermissionError:
+            continue
+
+    return env_files, yaml_files, json_files
+
+
+def validate_config_directory(
+    config_dir: str, max_workers: int = 4, fail_fast: bool = False
+) -> bool:
     """
     Validate a configuration directory with parallel processing.
 
@@ -621,11 +789,14 @@ def validate_config_directory(config_dir: str, max_workers: int = 4) -> bool:
     4. If all .json files in the directory are valid
 
     The validation is performed in parallel using a ThreadPoolExecutor
-    for better performance with large directories.
+    for better performance with large directories. By default all files are
+    validated so that every error is logged; with fail_fast, files that are
+    not yet being validated are skipped after the first failure.
 
     Args:
         config_dir: Path to the configuration directory to validate
         max_workers: Maximum number of worker threads for parallel validation (default: 4)
+        fail_fast: Stop validating further files after the first invalid one (default: False)
 
     Returns:
         bool: True if the directory and all its configuration files are valid, False otherwise
@@ -641,17 +812,14 @@ def validate_config_directory(config_dir: str, max_workers: int = 4) -> bool:
             print("Configuration directory is invalid")
         ```
     """
-    logging.debug(f"Validating configuration directory: {config_dir}")
+    logging.debug("Validating configuration directory: %s", config_dir)
     
     # Check if the directory exists
     if not validate_directory_exists(config_dir):
         return False
     
-    # Collect all files to validate
-    env_files = list(Path(config_dir).glob("**/*.env"))
-    yaml_files = list(Path(config_dir).glob("**/*.yml"))
-    yaml_files.extend(Path(config_dir).glob("**/*.yaml"))
-    json_files = list(Path(config_dir).glob("**/*.json"))
+    # Collect all files to validate in a single directory walk
+    env_files, yaml_files, json_files = _collect_config_files(config_dir)
     
     # Process files in batches with parallel execution
     all_valid = True
@@ -659,19 +827,26 @@ def validate_config_directory(config_dir: str, max_workers: int = 4) -> bool:
     # Use ThreadPoolExecutor for parallel validation
     with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
         # Submit validation tasks
-        env_futures = [executor.submit(validate_env_file, str(f)) for f in env_files]
-        yaml_futures = [executor.submit(validate_yaml_file, str(f)) for f in yaml_files]
-        json_futures = [executor.submit(validate_json_file, str(f)) for f in json_files]
+        # The files were found by the walk, so their existence is not checked again
+        env_futures = [executor.submit(_check_env_file, f) for f in env_files]
+        yaml_futures = [executor.submit(_check_yaml_file, f) for f in yaml_files]
+        json_futures = [executor.submit(_check_json_file, f) for f in json_files]
         
         # Collect results
-        for future in concurrent.futures.as_completed(env_futures + yaml_futures + json_futures):
+        futures = env_futures + yaml_futures + json_futures
+        for future in concurrent.futures.as_completed(futures):
             if not future.result():
                 all_valid = False
+                if fail_fast:
+                    # Skip the files that are still queued
+                    for pending in futures:
+                        pending.cancel()
+                    break
                 # Don't break early to collect all validation errors
     
     if all_valid:
         logging.success(f"Configuration directory validated: {config_dir}")
     else:
-        logging.error(f"Configuration directory validation failed: {config_dir}")
+        logging.error("Configuration directory validation failed: %s", config_dir)
         
     return all_valid
\ No newline at end of file
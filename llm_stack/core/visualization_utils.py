@@ -6,14 +6,22 @@ with consistent styling and error handling.
 """
 
 import os
+import shutil
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
-import matplotlib.pyplot as plt
 import networkx as nx
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure, SubplotParams
 
 from llm_stack.core import logging
 
+# Graphs with more nodes get a cheaper layout and no edge labels
+LARGE_GRAPH_NODES = 500
+
+# Reusable figures by size, drawn with the Agg canvas and cleared between charts
+_FIGURES: Dict[Tuple[int, int], Figure] = {}
+
 
 def create_directory(output_dir: Union[str, Path]) -> Path:
     """
@@ -32,22 +40,86 @@ def create_directory(output_dir: Union[str, Path]) -> Path:
     return output_dir
 
 
+def _get_figure(figsize: Tuple[int, int]) -> Figure:
+    """
+    Get an empty figure of the given size.
+
+    The figure is created once per size and reused for later charts, which
+    avoids setting up a new figure and canvas for every visualization.
+
+    Args:
+        figsize: Figure size (width, height)
+
+    Returns:
+        Figure: Figure without axes
+    """
+    figsize = tuple(figsize)
+    fig = _FIGURES.get(figsize)
+    if fig is None:
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        _FIGURES[figsize] = fig
+    else:
+        fig.clear()
+        # tight_layout of a previous chart changes the subplot parameters
+        fig.subplotpars = SubplotParams()
+
+    return fig
+
+
+def _graph_layout(graph: nx.DiGraph) -> Dict:
+    """
+    Compute node positions for a network graph.
+
+    Small graphs use the spring layout. Large graphs use Graphviz sfdp if it
+    and pygraphviz are installed, otherwise a spring layout with fewer
+    iterations, as each spring iteration is quadratic in the number of nodes.
+
+    Args:
+        graph: NetworkX graph to lay out
+
+    Returns:
+        Dict: Positions by node
+    """
+    if graph.number_of_nodes() <= LARGE_GRAPH_NODES:
+        return nx.spring_layout(graph, seed=42)
+
+    if shutil.which("sfdp"):
+        try:
+            return nx.nx_agraph.graphviz_layout(graph, prog="sfdp")
+        except ImportError:
+            logging.debug("pygraphviz not available, using spring layout")
+
+    return nx.spring_layout(graph, seed=42, iterations=30)
+
+
 def create_network_graph(
     graph: nx.DiGraph,
     output_path: Union[str, Path],
     title: str,
     node_color: str = 'lightblue',
-    figsize: Tuple[int, int] = (12, 10)
+    figsize: Tuple[int, int] = (12, 10),
+    dpi: int = 100,
+    image_format: Optional[str] = None
 ) -> str:
     """
     Create and save a network graph visualization.
 
+    Graphs with more than LARGE_GRAPH_NODES nodes are drawn with a cheaper
+    layout and without edge labels. The image format follows the file
+    extension unless image_format is given; vector formats like "svg" or "pdf"
+    write every node and edge individually and are much slower for large
+    graphs than a raster format like "png".
+
     Args:
         graph: NetworkX graph to visualize
         output_path: Path to save the visualization
         title: Title for the visualization
         node_color: Color for the nodes
         figsize: Figure size (width, height)
+        dpi: Resolution of the image in dots per inch
+        image_format: Image format passed to matplotlib (e.g. "png" or "svg"),
+            None to infer it from the extension of output_path
 
     Returns:
         str: Path to the saved visualization
@@ -59,27 +131,28 @@ def create_network_graph(
         return ""
     
     try:
-        # Create a figure
-        plt.figure(figsize=figsize)
+        # Get a figure with axes covering all of it, as nx.draw uses without axes
+        fig = _get_figure(figsize)
+        ax = fig.add_axes((0, 0, 1, 1))
         
         # Create a layout for the graph
-        pos = nx.spring_layout(graph, seed=42)
+        pos = _graph_layout(graph)
         
         # Draw the graph
-        nx.draw(graph, pos, with_labels=True, node_color=node_color, 
+        nx.draw(graph, pos, ax=ax, with_labels=True, node_color=node_color, 
                 node_size=1500, font_size=10, font_weight='bold', 
                 arrowsize=15, width=2, edge_color='gray')
         
-        # Draw edge labels
-        edge_labels = {(u, v): d.get('relationship', '') for u, v, d in graph.edges(data=True)}
-        nx.draw_networkx_edge_labels(graph, pos, edge_labels=edge_labels, font_size=8)
+        # Draw edge labels (skipped for large graphs, where they dominate the rendering time)
+        if graph.number_of_nodes() <= LARGE_GRAPH_NODES:
+            edge_labels = {(u, v): d.get('relationship', '') for u, v, d in graph.edges(data=True)}
+            nx.draw_networkx_edge_labels(graph, pos, edge_labels=edge_labels, font_size=8, ax=ax)
         
         # Set title
-        plt.title(title, fontsize=16)
+        ax.set_title(title, fontsize=16)
         
         # Save the figure
-        plt.savefig(output_path)
-        plt.close()
+        fig.savefig(output_path, format=image_format, dpi=dpi)
         
         logging.info(f"Network graph visualization saved to {output_path}")
         return str(output_path)
@@ -122,30 +195,32 @@ def create_bar_chart(
         return ""
     
     try:
-        # Create a figure
-        plt.figure(figsize=figsize)
+        # Get a figure
+        fig = _get_figure(figsize)
+        ax = fig.add_subplot(111)
         
         # Create a bar chart
         labels = list(data.keys())
         values = list(data.values())
         
-        plt.bar(labels, values, color=color)
+        ax.bar(labels, values, color=color)
         
         # Add labels and title
-        plt.xlabel(xlabel, fontsize=12)
-        plt.ylabel(ylabel, fontsize=12)
-        plt.title(title, fontsize=16)
+        ax.set_xlabel(xlabel, fontsize=12)
+        ax.set_ylabel(ylabel, fontsize=12)
+        ax.set_title(title, fontsize=16)
         
         # Rotate x-axis labels for better readability if needed
         if rotate_labels:
-            plt.xticks(rotation=45, ha='right')
+            for label in ax.get_xticklabels():
+                label.set_rotation(45)
+                label.set_horizontalalignment('right')
         
         # Adjust layout
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save the figure
-        plt.savefig(output_path)
-        plt.close()
+        fig.savefig(output_path)
         
         logging.info(f"Bar chart visualization saved to {output_path}")
         return str(output_path)
@@ -186,26 +261,26 @@ def create_pie_chart(
         return ""
     
     try:
-        # Create a figure
-        plt.figure(figsize=figsize)
+        # Get a figure
+        fig = _get_figure(figsize)
+        ax = fig.add_subplot(111)
         
         # Default colors if not provided
         if colors is None:
             colors = ['#66b3ff', '#ff9999', '#99ff99', '#ffcc99', '#c2c2f0']
         
         # Create a pie chart
-        plt.pie(sizes, explode=explode, labels=labels, colors=colors,
-                autopct='%1.1f%%', shadow=True, startangle=90)
+        ax.pie(sizes, explode=explode, labels=labels, colors=colors,
+               autopct='%1.1f%%', shadow=True, startangle=90)
         
         # Equal aspect ratio ensures that pie is drawn as a circle
-        plt.axis('equal')
+        ax.axis('equal')
         
         # Set title
-        plt.title(title, fontsize=16)
+        ax.set_title(title, fontsize=16)
         
         # Save the figure
-        plt.savefig(output_path)
-        plt.close()
+        fig.savefig(output_path)
         
         logging.info(f"Pie chart visualization saved to {output_path}")
         return str(output_path)
@@ -250,23 +325,23 @@ def create_line_chart(
         return ""
     
     try:
-        # Create a figure
-        plt.figure(figsize=figsize)
+        # Get a figure
+        fig = _get_figure(figsize)
+        ax = fig.add_subplot(111)
         
         # Create a line chart
-        plt.plot(x_values, y_values, color=color, marker=marker)
+        ax.plot(x_values, y_values, color=color, marker=marker)
         
         # Add labels and title
-        plt.xlabel(xlabel, fontsize=12)
-        plt.ylabel(ylabel, fontsize=12)
-        plt.title(title, fontsize=16)
+        ax.set_xlabel(xlabel, fontsize=12)
+        ax.set_ylabel(ylabel, fontsize=12)
+        ax.set_title(title, fontsize=16)
         
         # Adjust layout
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save the figure
-        plt.savefig(output_path)
-        plt.close()
+        fig.savefig(output_path)
         
         logging.info(f"Line chart visualization saved to {output_path}")
         return str(output_path)
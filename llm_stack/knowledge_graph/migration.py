@@ -6,6 +6,7 @@ migration decisions in the Knowledge Graph.
 """
 
 import functools
+import hashlib
 import time
 import uuid
 from datetime import datetime
@@ -27,6 +28,9 @@ _FILE_NODE_CACHE = {}
 _DECISION_NODE_CACHE = {}
 _CACHE_TTL = 300  # Cache TTL in seconds
 
+# Content hash and node of Bash files recorded from disk, by file path
+_BASH_FILE_HASHES: Dict[str, Tuple[str, Dict]] = {}
+
 # Initialize indexes on module import
 _INDEXES_INITIALIZED = False
 
@@ -625,6 +629,42 @@ def record_bash_file(
         return None
 
 
+def record_bash_file_from_path(
+    file_path: str, source_path: str, client: Optional[Neo4jClient] = None
+) -> Optional[Dict]:
+    """
+    Records a Bash file in the Knowledge Graph, reading its content from disk.
+
+    The content is only sent if its SHA-256 hash changed since the file was
+    last recorded in this process.
+
+    Args:
+        file_path: Path to the Bash file as recorded in the Knowledge Graph
+        source_path: Path to the Bash file on disk
+        client: Neo4j client instance
+
+    Returns:
+        Optional[Dict]: Recorded file node or None if an error occurred
+    """
+    try:
+        with open(source_path, "rb") as f:
+            raw_content = f.read()
+        content = raw_content.decode("utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        logging.error(f"Error reading Bash file {source_path}: {str(e)}")
+        return None
+
+    content_hash = hashlib.sha256(raw_content).hexdigest()
+    cached = _BASH_FILE_HASHES.get(file_path)
+    if cached is not None and cached[0] == content_hash:
+        return cached[1]
+
+    file_node = record_bash_file(file_path, content, client=client)
+    if file_node is not None:
+        _BASH_FILE_HASHES[file_path] = (content_hash, file_node)
+    return file_node
+
+
 @ensure_indexes
 def record_python_file(
     file_path: str,